@@ -0,0 +1,63 @@
+"""
+Global stiffness assembly benchmark.
+
+Compares band storage assembly with full matrix assembly for growing
+number of elements. Time per element of band assembly should stay
+roughly constant, which means assembly scales linearly.
+
+Run with:
+    python -m easyfem.benchmarks.assembly
+"""
+
+from timeit import repeat
+
+import numpy as np
+
+from easyfem.easybeam import Beam
+from easyfem.easybeam.linalg import (
+    chain_dofs, assemble_band, assemble_dense
+)
+
+ELEMENTS = (100, 1000, 10000, 100000, 1000000)
+DENSE_LIMIT = 5000
+
+
+def element_matrices(number_of_elements):
+    beam = Beam(1.0 / number_of_elements)
+    return np.broadcast_to(
+        beam.stifness_matrix, (number_of_elements, 4, 4)
+        )
+
+
+def best_time(function, number=3):
+    return min(repeat(function, number=1, repeat=number))
+
+
+def main():
+    print('{:>10} {:>14} {:>14} {:>14}'.format(
+        'elements', 'banded [s]', 'per elem [us]', 'dense [s]'
+        ))
+
+    for number_of_elements in ELEMENTS:
+        matrixes = element_matrices(number_of_elements)
+        dofs = chain_dofs(number_of_elements)
+        n = 2*number_of_elements + 2
+
+        banded = best_time(lambda: assemble_band(matrixes, dofs, n))
+        if number_of_elements <= DENSE_LIMIT:
+            dense = '{:14.6f}'.format(
+                best_time(lambda: assemble_dense(matrixes, dofs, n))
+                )
+        else:
+            dense = '{:>14}'.format('-')
+
+        print('{:>10} {:14.6f} {:14.4f} {}'.format(
+            number_of_elements,
+            banded,
+            1e6 * banded / number_of_elements,
+            dense
+            ))
+
+
+if __name__ == '__main__':
+    main()
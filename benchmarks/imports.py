@@ -0,0 +1,116 @@
+"""
+Import time benchmark of easyfem packages.
+
+Every package is imported in fresh interpreter, best of few runs is
+reported together with heavy modules (matplotlib, scipy) that import
+loaded. Results may be saved as JSON baseline and compared with another
+baseline like in benchmarks.suite.
+
+Run with:
+    python -m easyfem.benchmarks.imports --output imports.json
+    python -m easyfem.benchmarks.imports --compare imports.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+PACKAGES = ('easyfem.easybeam', 'easyfem.easysections')
+HEAVY_MODULES = ('matplotlib', 'scipy')
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+import {package}
+wall_time = time.perf_counter() - start
+print(wall_time, *(name in sys.modules for name in {heavy!r}))
+'''
+
+
+def measure(package, repeat):
+    '''
+    best import time of package in fresh interpreters and
+    flags of heavy modules loaded by import
+    '''
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(
+                package=package, heavy=HEAVY_MODULES
+                )],
+            check=True, capture_output=True, text=True
+            ).stdout.split()
+        times.append(float(output[0]))
+
+    return min(times), {
+        name: flag == 'True' for name, flag in zip(HEAVY_MODULES, output[1:])
+    }
+
+
+def run(packages, repeat):
+    results = []
+
+    for package in packages:
+        wall_time, loaded = measure(package, repeat)
+        results.append({
+            'package': package,
+            'time': wall_time,
+            'loaded': loaded,
+        })
+        print('{:<24} {:10.4f} s   loads: {}'.format(
+            package, wall_time,
+            ', '.join(name for name, flag in loaded.items() if flag) or '-'
+            ))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    '''
+    prints packages slower than baseline by more than
+    threshold ratio, returns number of regressions
+    '''
+    old = {row['package']: row for row in baseline['results']}
+    regressions = 0
+
+    for row in results:
+        if row['package'] not in old:
+            continue
+        ratio = row['time'] / max(old[row['package']]['time'], 1e-9)
+        if ratio > threshold:
+            regressions += 1
+            print('REGRESSION {:<24} time x{:.2f}'.format(
+                row['package'], ratio
+                ))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--packages', nargs='+', default=PACKAGES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='save results as JSON baseline')
+    parser.add_argument('--compare', help='JSON baseline to compare with')
+    parser.add_argument(
+        '--threshold', type=float, default=1.5,
+        help='slowdown ratio reported as regression')
+    args = parser.parse_args(argv)
+
+    results = run(args.packages, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'results': results}, output, indent=1)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            if compare(results, json.load(baseline), args.threshold):
+                return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
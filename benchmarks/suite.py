@@ -0,0 +1,200 @@
+"""
+Benchmark suite of easybeam.
+
+Measures wall time and peak memory (tracemalloc) of Beam construction,
+discretization, every BeamSolver phase and result helpers for growing
+number of elements. Factorization is timed as separate phase from
+scratch every run, solver phase solves with cached factors. Results
+may be saved as JSON baseline and compared with another baseline,
+regressions are reported and make the run fail.
+
+Run with:
+    python -m easyfem.benchmarks.suite --output baseline.json
+    python -m easyfem.benchmarks.suite --compare baseline.json
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from easyfem.easybeam import (
+    Beam, BeamSolver, discretization,
+    coordinates_array, momments_array, shears_array,
+    disps_array, rotations_array, results_array
+)
+
+ELEMENTS = (10, 100, 1000, 10000, 100000)
+MODELS = ('beams', 'mesh')
+
+SOLVER_PHASES = (
+    'internal_agregation',
+    'internal_boundaries',
+    'internal_system_loads',
+    'apply_boundaries',
+    'factorize',
+    'solver',
+)
+
+HELPERS = (
+    coordinates_array, momments_array, shears_array,
+    disps_array, rotations_array, results_array
+)
+
+
+def measure(function, repeat):
+    '''
+    best wall time of few runs and peak
+    memory allocated during separate traced run
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return min(times), peak
+
+
+def sample_beam(length=100.0):
+    beam = Beam(length, 2.1e8)
+    beam.boundary(True, False, True, True)
+    beam.loads(force_1=10, moment_2=5, linear_load=1000)
+    return beam
+
+
+def phases(model, number_of_elements):
+    '''
+    (name, function) pairs of benchmarked phases, every
+    function works on objects prepared by previous ones
+    '''
+    beam = sample_beam()
+    mesh = model == 'mesh'
+    state = {}
+
+    def construct():
+        return [Beam(1.0) for _ in range(number_of_elements)]
+
+    def discretize():
+        state['beams'] = discretization(beam, number_of_elements, mesh=mesh)
+
+    def solve():
+        state['solver'] = BeamSolver(state['beams'])
+
+    if not mesh:
+        yield 'Beam', construct
+    yield 'discretization', discretize
+    yield 'BeamSolver', solve
+
+    def factorize():
+        # factors are cached by solver, so every run starts without them
+        state['solver'].stiffness_factorization = None
+        state['solver'].factorize()
+
+    for name in SOLVER_PHASES:
+        if name == 'factorize':
+            yield name, factorize
+        else:
+            # solver reuses factors of factorize phase
+            yield name, lambda name=name: getattr(state['solver'], name)()
+
+    for helper in HELPERS:
+        yield helper.__name__, \
+            lambda helper=helper: helper(state['solver'].beams)
+
+
+def run(elements, models, repeat):
+    results = []
+
+    for model in models:
+        for number_of_elements in elements:
+            for phase, function in phases(model, number_of_elements):
+                wall_time, peak = measure(function, repeat)
+                results.append({
+                    'model': model,
+                    'elements': number_of_elements,
+                    'phase': phase,
+                    'time': wall_time,
+                    'peak_memory': peak,
+                })
+                print('{:>6} {:>8} {:<22} {:12.6f} s {:12.1f} kB'.format(
+                    model, number_of_elements, phase,
+                    wall_time, peak / 1024
+                    ))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    '''
+    prints phases slower than baseline by more than
+    threshold ratio, returns number of regressions
+    '''
+    old = {
+        (row['model'], row['elements'], row['phase']): row
+        for row in baseline['results']
+    }
+    regressions = 0
+
+    for row in results:
+        key = (row['model'], row['elements'], row['phase'])
+        if key not in old:
+            continue
+        ratio = row['time'] / max(old[key]['time'], 1e-9)
+        memory_ratio = row['peak_memory'] / max(old[key]['peak_memory'], 1)
+        if ratio > threshold or memory_ratio > threshold:
+            regressions += 1
+            print('REGRESSION {:>6} {:>8} {:<22} time x{:.2f} '
+                  'memory x{:.2f}'.format(*key, ratio, memory_ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '--elements', type=int, nargs='+', default=ELEMENTS)
+    parser.add_argument(
+        '--models', nargs='+', choices=MODELS, default=MODELS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='save results as JSON baseline')
+    parser.add_argument('--compare', help='JSON baseline to compare with')
+    parser.add_argument(
+        '--threshold', type=float, default=1.5,
+        help='slowdown ratio reported as regression')
+    args = parser.parse_args(argv)
+
+    results = run(args.elements, args.models, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({
+                'meta': {
+                    'date': datetime.datetime.now().isoformat(),
+                    'python': platform.python_version(),
+                    'numpy': np.__version__,
+                    'platform': platform.platform(),
+                },
+                'results': results,
+            }, output, indent=1)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            if compare(results, json.load(baseline), args.threshold):
+                return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
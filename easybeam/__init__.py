@@ -1,19 +1,69 @@
 from easyfem.easybeam.classes import (
-    Beam, BeamSolver,
+    Beam, BeamMesh, BeamSolver, BeamResults,
 )
 
 from easyfem.easybeam.funcs import (
-    discretization,
+    discretization, adaptive_discretization,
     coordinates_array, momments_array, shears_array,
-    disps_array, rotations_array
+    disps_array, rotations_array, results_array
 )
 
-from easyfem.easybeam import easybeam_visualize
+from easyfem.easybeam.topology import number_dofs, DofNumbering
+
+from easyfem.easybeam.sweep import sweep, SweepResults
+
+from easyfem.easybeam.parallel import solve_many
+
+from easyfem.easybeam.export import results_chunks, export_npz
+
+from easyfem.easybeam.modelfile import save_model, load_model
+
+from easyfem.easybeam.moving import (
+    influence_lines, InfluenceLines, moving_load, envelope
+)
+
+from easyfem.easybeam.modal import modal_analysis, ModalResults
+
+from easyfem.easybeam.dynamics import time_history, TimeStep
+
+from importlib import import_module
+
+# plotting tools import matplotlib, so they are loaded on first access
+LAZY_ATTRIBUTES = {
+    'easybeam_visualize': ('easyfem.easybeam.easybeam_visualize', None),
+    'ResultsFigure': ('easyfem.easybeam.render', 'ResultsFigure'),
+    'render_results': ('easyfem.easybeam.render', 'render_results'),
+    'render_batch': ('easyfem.easybeam.render', 'render_batch'),
+}
+
+
+def __getattr__(name):
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+            )
+    module_name, attribute = LAZY_ATTRIBUTES[name]
+    value = import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
+
 
 __all__ = [
-    'Beam', 'BeamSolver',
-    'discretization',
+    'Beam', 'BeamMesh', 'BeamSolver', 'BeamResults',
+    'discretization', 'adaptive_discretization',
     'coordinates_array', 'momments_array', 'shears_array',
-    'disps_array', 'rotations_array',
+    'disps_array', 'rotations_array', 'results_array',
+    'number_dofs', 'DofNumbering',
+    'sweep', 'SweepResults', 'solve_many',
+    'results_chunks', 'export_npz', 'save_model', 'load_model',
+    'influence_lines', 'InfluenceLines', 'moving_load', 'envelope',
+    'modal_analysis', 'ModalResults', 'time_history', 'TimeStep',
+    'ResultsFigure', 'render_results', 'render_batch',
     'easybeam_visualize'
 ]
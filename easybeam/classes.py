@@ -6,14 +6,33 @@ easyfem Analysis Tools
 easyfem classes tools
 =============================================================================
 Beam                Default 1D beam element
+element_stiffness_matrix
+                    Cached stifness matrix shared by identical elements
+BeamMesh            Compact array based set of beam elements for large
+                    discretizations
+MeshBeam            View of single BeamMesh element, that behaves like Beam
 BeamSolver          Object that sticks beam elements together, and solve it
+BeamResults         Immutable results of BeamSolver.solve
 =================== ==========================================================
 
 """
 
 import numpy as np
 import numpy.linalg as lp
+from functools import lru_cache
 from itertools import chain
+from threading import RLock
+from easyfem.easybeam.linalg import (
+    BACKENDS, BandedCholesky, LowRankUpdate,
+    assemble_band, assemble_dense, assemble_vector, add_to_band,
+    band_to_dense, dense_to_band, reduce_band, choose_backend
+)
+from easyfem.easybeam.profiling import SolverReport, phase
+from easyfem.easybeam.topology import chain_numbering, number_dofs
+from easyfem.easysections.arrays import SectionArray
+
+# number of distinct element stifness matrices kept by cache
+STIFFNESS_CACHE_SIZE = 4096
 
 # My very first FEM solver program
 # Author's name: Beniamin Dudek
@@ -25,6 +44,61 @@ class No_Data(ValueError):
     pass
 
 
+@lru_cache(maxsize=STIFFNESS_CACHE_SIZE)
+def element_stiffness_matrix(length, youngs_modulus, moment_of_inertia_z):
+    '''
+    read-only stifness matrix of 1D beam element, cached
+    (hit/miss statistics: element_stiffness_matrix.cache_info())
+    '''
+    matrix = (
+        (2*youngs_modulus*moment_of_inertia_z)
+        / (length**3)
+        ) * np.array(
+            [
+                [6, 3*length, -6, 3*length],
+                [3*length, 2*length**2,
+                    -3*length, length**2],
+                [-6, -3*length, 6, -3*length],
+                [3*length, length**2,
+                    -3*length, 2*length**2]]
+            )
+    matrix.flags.writeable = False
+    return matrix
+
+
+def element_mass_matrices(lengths, masses, lumped=False):
+    '''
+    (n, 4, 4) consistent (Hermite) mass matrices of 1D beam
+    elements with given masses per unit length (density * area);
+    lumped ones keep translational mass at ends and rotational
+    inertia of HRZ diagonal scaling
+    '''
+    length = np.asarray(lengths, dtype=float)
+    factor = np.asarray(masses, dtype=float) * length
+    if lumped:
+        diagonal = np.stack(
+            [0.5*factor, factor*length**2/78, 0.5*factor,
+             factor*length**2/78],
+            axis=-1
+            ).reshape(-1, 4)
+        matrixes = np.zeros(diagonal.shape + (4,))
+        matrixes[:, np.arange(4), np.arange(4)] = diagonal
+        return matrixes
+
+    ones = np.ones_like(length)
+    matrixes = np.stack(
+        [
+            156*ones, 22*length, 54*ones, -13*length,
+            22*length, 4*length**2, 13*length, -3*length**2,
+            54*ones, 13*length, 156*ones, -22*length,
+            -13*length, -3*length**2, -22*length, 4*length**2
+        ],
+        axis=-1
+        ).reshape(-1, 4, 4)
+
+    return (factor / 420).reshape(-1, 1, 1) * matrixes
+
+
 class Beam:
     # TODO:
     #   > use loads method \ad beginning
@@ -32,11 +106,12 @@ class Beam:
     #   > define sample boundary at beginning
     # 1D Beam Finite Element
 
-    def __init__(self, length, youngs_modulus=1, section=False):
+    def __init__(self, length, youngs_modulus=1, section=False, density=1):
 
         self.length = length  # unit: m
         self.youngs_modulus = youngs_modulus
         self.section = section  # units: m
+        self.density = density  # unit: kg/m^3
         self.stifness()
 
         # some default definitons
@@ -62,6 +137,17 @@ class Beam:
     # Stifness matrix for 1D beam element.
     def stifness(self):
 
+        if isinstance(self.section, SectionArray):
+            # single element takes single profile only
+            if len(self.section) != 1:
+                raise TypeError(
+                    'Beam takes one section, not {!r}; use one item '
+                    '(section[i]) or BeamMesh for arrays of sections'.format(
+                        self.section
+                        )
+                    )
+            self.section = self.section[0]
+
         if self.section:
             self.area = self.section.area  # m^2
             self.moment_of_inertia_y = self.section.moment_of_inertia_y  # m^4
@@ -75,22 +161,25 @@ class Beam:
             self.elastic_modulus_y = 1  # unit: m^3
             self.elastic_modulus_z = 1  # unit m^3
 
+        # identical elements share one read-only matrix
         try:
-            self.stifness_matrix = (
-                (2*self.youngs_modulus*self.moment_of_inertia_z)
-                / (self.length**3)
-                ) * np.array(
-                    [
-                        [6, 3*self.length, -6, 3*self.length],
-                        [3*self.length, 2*self.length**2,
-                            -3*self.length, self.length**2],
-                        [-6, -3*self.length, 6, -3*self.length],
-                        [3*self.length, self.length**2,
-                            -3*self.length, 2*self.length**2]]
-                    )
+            self.stifness_matrix = element_stiffness_matrix(
+                self.length, self.youngs_modulus, self.moment_of_inertia_z
+                )
+        except TypeError:
+            # unhashable values (arrays) are not cached
+            self.stifness_matrix = element_stiffness_matrix.__wrapped__(
+                self.length, self.youngs_modulus, self.moment_of_inertia_z
+                )
         except NameError:
             raise No_Data
 
+    # Mass matrix for 1D beam element (uses area set by stifness).
+    def mass_matrix(self, lumped=False):
+        return element_mass_matrices(
+            self.length, self.density*self.area, lumped
+            )[0]
+
     def boundary(self, vertical_1, rotation_1, vertical_2, rotation_2):
         self.vertical_1 = bool(vertical_1)
         self.rotation_1 = bool(rotation_1)
@@ -129,118 +218,1067 @@ class Beam:
     def internal_forces(self, solved_forces):
         self.__solved_forces__ = solved_forces
         self.internal_forces_array = \
-            (-1)*np.transpose(np.matrix(self.system_loads)) + \
-            self.stifness_matrix * np.transpose(
-                np.matrix(self.__solved_forces__)
-                )
-
-        self.internal_forces_array = np.array(
-            np.transpose(self.internal_forces_array)
-            )[0]
+            self.stifness_matrix @ self.__solved_forces__ - self.system_loads
 
     def solve(self):
         return self.__solved_forces__
 
 
-class BeamSolver:
+def _row_property(name, column=None):
+    # property reading and writing one row of BeamMesh array
+
+    def getter(self):
+        array = getattr(self.mesh, name)
+        if column is None:
+            return array[self.index]
+        return array[self.index, column]
+
+    def setter(self, value):
+        array = self.mesh.writable(name)
+        if column is None:
+            array[self.index] = value
+        else:
+            array[self.index, column] = value
 
-    def __init__(self, *beams):
-        self.beams = tuple(chain.from_iterable(beams))
+    return property(getter, setter)
 
-        self.n = 4 + (len(self.beams)-1)*2
 
-        self.internal_agregation()
-        self.internal_boundaries()
-        self.internal_system_loads()
-        self.apply_boundaries()
-        self.solver()
+class MeshBeam(Beam):
+    # Thin view of one element of BeamMesh.
+    # Behaves like Beam, but all data is read from
+    # and written to arrays of the mesh.
 
-    def internal_agregation(self):
+    length = _row_property('lengths')
+    youngs_modulus = _row_property('youngs_modulus')
+    density = _row_property('density')
+    area = _row_property('area')
+    moment_of_inertia_y = _row_property('moment_of_inertia_y')
+    moment_of_inertia_z = _row_property('moment_of_inertia_z')
+    elastic_modulus_y = _row_property('elastic_modulus_y')
+    elastic_modulus_z = _row_property('elastic_modulus_z')
 
-        matrixes = [matrix.stifness_matrix for matrix in self.beams]
+    vertical_1 = _row_property('boundaries', 0)
+    rotation_1 = _row_property('boundaries', 1)
+    vertical_2 = _row_property('boundaries', 2)
+    rotation_2 = _row_property('boundaries', 3)
 
-        self.global_stiffness_matrix = np.zeros([self.n, self.n])
+    linear_load = _row_property('linear_load')
+    init_force_1 = _row_property('end_loads', 0)
+    init_moment_1 = _row_property('end_loads', 1)
+    init_force_2 = _row_property('end_loads', 2)
+    init_moment_2 = _row_property('end_loads', 3)
 
-        for i in range(len(matrixes)):
-            current_matrix = np.zeros([self.n, self.n])
-            current_matrix[(0+2*i):(4+2*i), (0+2*i):(4+2*i)] = matrixes[i]
-            self.global_stiffness_matrix = \
-                self.global_stiffness_matrix + current_matrix
+    def __init__(self, mesh, index):
+        self.mesh = mesh
+        self.index = index
 
-    def internal_boundaries(self):
+    @property
+    def section(self):
+        if self.index in self.mesh.sections:
+            return self.mesh.sections[self.index]
+        if isinstance(self.mesh.section, SectionArray):
+            # array of one profile is shared by all elements
+            if len(self.mesh.section) == 1:
+                return self.mesh.section[0]
+            return self.mesh.section[self.index]
+        return self.mesh.section
 
-        vectors = [np.array(beam.boundaries) for beam in self.beams]
+    @section.setter
+    def section(self, section):
+        self.mesh.sections[self.index] = section
 
-        self.global_boundary_vector = np.zeros([self.n])
+    @property
+    def stifness_matrix(self):
+        return self.mesh.stiffness_matrices([self.index])[0]
 
-        for i in range(len(vectors)):
-            current_vector = np.zeros([self.n])
-            current_vector[(0+2*i):(4+2*i)] = vectors[i]
-            self.global_boundary_vector = \
-                self.global_boundary_vector + current_vector
+    @property
+    def boundaries(self):
+        return [bool(flag) for flag in self.mesh.boundaries[self.index]]
 
-        # turning values from global_boundary_vector to bools
-        self.global_boundary_vector = np.array(
-            [bool(element) for element in self.global_boundary_vector]
+    @property
+    def system_loads(self):
+        return self.mesh.system_loads([self.index])[0]
+
+    force_1 = property(lambda self: self.system_loads[0])
+    moment_1 = property(lambda self: self.system_loads[1])
+    force_2 = property(lambda self: self.system_loads[2])
+    moment_2 = property(lambda self: self.system_loads[3])
+
+    @property
+    def internal_forces_array(self):
+        return self.mesh.internal_forces[self.index]
+
+    def stifness(self):
+        self.mesh.set_section(self.index, self.section)
+
+    def boundary(self, vertical_1, rotation_1, vertical_2, rotation_2):
+        self.mesh.writable('boundaries')[self.index] = [
+            vertical_1, rotation_1, vertical_2, rotation_2
+            ]
+
+    def loads(
+        self, force_1=0, force_2=0, moment_1=0, moment_2=0, linear_load=0
+            ):
+        self.linear_load = linear_load
+        self.mesh.writable('end_loads')[self.index] = [
+            force_1, moment_1, force_2, moment_2
+            ]
+
+    def internal_forces(self, solved_forces):
+        if self.mesh.internal_forces is None:
+            self.mesh.internal_forces = np.zeros([len(self.mesh), 4])
+            self.mesh.displacements = np.zeros([len(self.mesh), 4])
+        self.mesh.displacements[self.index] = solved_forces
+        self.mesh.internal_forces[self.index] = \
+            self.stifness_matrix @ solved_forces - self.system_loads
+
+    def solve(self):
+        return self.mesh.displacements[self.index]
+
+
+class BeamMesh:
+    # Compact structure-of-arrays set of 1D beam elements chained end
+    # to end, or connected by nodes given explicitly. Properties shared
+    # by all elements are kept as read-only broadcast views and copied
+    # only when a single element is changed.
+    # Unlike Beam, elements have no boundaries and no loads by default.
+    #
+    # lengths      - (n,) lengths of elements
+    # section      - Section for all elements, or object with arrays
+    #                of section properties (one value per element),
+    #                like SectionArray
+    # linear_load  - scalar or (n,) distributed loads
+    # end_loads    - (n, 4) nodal loads [force_1, moment_1, force_2,
+    #                moment_2] given for elements like in Beam.loads
+    # boundaries   - (n, 4) boundary flags like in Beam.boundary
+    # density      - scalar or (n,) densities used by mass matrices
+    # nodes        - (n, 2) identifiers (any integers) of start and end
+    #                node of every element, elements may be given in any
+    #                order and share nodes anywhere (deflection and
+    #                rotation are common at shared node); None means
+    #                elements chained end to end in given order.
+    #                Coordinate based tools (coordinates_array,
+    #                results_array, export, rendering, influence lines)
+    #                raise ValueError for meshes with nodes.
+
+    properties = (
+        'area',
+        'moment_of_inertia_y', 'moment_of_inertia_z',
+        'elastic_modulus_y', 'elastic_modulus_z'
         )
 
-    def internal_system_loads(self):
+    def __init__(
+        self, lengths, youngs_modulus=1, section=False,
+        linear_load=0, end_loads=None, boundaries=None, density=1,
+        nodes=None
+            ):
+
+        self.lengths = np.asarray(lengths, dtype=float)
+        n = self.lengths.size
+
+        self.youngs_modulus = self.broadcast(youngs_modulus)
+        self.density = self.broadcast(density)
+        self.section = section
+        self.sections = {}
+        for name in self.properties:
+            setattr(self, name, self.broadcast(
+                getattr(section, name) if section else 1
+                ))
+
+        self.linear_load = self.broadcast(linear_load)
+        self.end_loads = np.zeros([n, 4]) if end_loads is None else \
+            np.asarray(end_loads, dtype=float)
+        self.boundaries = np.zeros([n, 4], dtype=bool) \
+            if boundaries is None else np.asarray(boundaries, dtype=bool)
+        self.nodes = None if nodes is None else \
+            np.asarray(nodes, dtype=np.int64).reshape(n, 2)
+
+        # results written by BeamSolver
+        self.internal_forces = None
+        self.displacements = None
+
+    def __repr__(self):
+
+        return '{}({} elements)'.format(
+            __class__.__name__,  # noqa: F821
+            len(self)
+            )
+
+    def __len__(self):
+        return self.lengths.size
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('element index out of range')
+        return MeshBeam(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield MeshBeam(self, index)
+
+    def broadcast(self, value):
+        # read-only (n,) view, scalars take no memory per element
+        return np.broadcast_to(
+            np.asarray(value, dtype=float), self.lengths.shape
+            )
+
+    def writable(self, name):
+        # array of given name, copied first if it is read-only view
+        array = getattr(self, name)
+        if not array.flags.writeable:
+            array = np.array(array)
+            setattr(self, name, array)
+        return array
+
+    @property
+    def element_nodes(self):
+        # (n, 2) nodes of elements, consecutive integers when chained
+        if self.nodes is not None:
+            return self.nodes
+        return np.arange(len(self))[:, np.newaxis] + np.arange(2)
+
+    def node_end(self, node):
+        # first element with end at given node and first
+        # column of this end in end_loads and boundaries
+        elements, ends = np.nonzero(self.element_nodes == node)
+        if not elements.size:
+            raise KeyError('no element at node {}'.format(node))
+        return elements[0], 2*ends[0]
+
+    def support(self, node, vertical=True, rotation=False):
+        # boundary flags of node, flags of other
+        # elements ending at node apply as well
+        element, column = self.node_end(node)
+        self.writable('boundaries')[element, column:column+2] = \
+            vertical, rotation
+
+    def node_load(self, node, force=0, moment=0):
+        # nodal force and moment added at node
+        element, column = self.node_end(node)
+        self.writable('end_loads')[element, column:column+2] += \
+            force, moment
+
+    def set_section(self, elements, section):
+        for name in self.properties:
+            self.writable(name)[elements] = \
+                getattr(section, name) if section else 1
+
+    def stiffness_matrices(self, elements=None):
+        # (n, 4, 4) stifness matrices of all (or chosen) elements
+        if elements is None:
+            elements = slice(None)
+
+        length = self.lengths[elements]
+        ones = np.ones_like(length)
+        matrixes = np.stack(
+            [
+                6*ones, 3*length, -6*ones, 3*length,
+                3*length, 2*length**2, -3*length, length**2,
+                -6*ones, -3*length, 6*ones, -3*length,
+                3*length, length**2, -3*length, 2*length**2
+            ],
+            axis=-1
+            ).reshape(-1, 4, 4)
+
+        factor = (
+            2*self.youngs_modulus[elements] *
+            self.moment_of_inertia_z[elements]
+            ) / length**3
+
+        return factor[:, np.newaxis, np.newaxis] * matrixes
+
+    def mass_matrices(self, elements=None, lumped=False):
+        # (n, 4, 4) mass matrices of all (or chosen) elements
+        if elements is None:
+            elements = slice(None)
+
+        return element_mass_matrices(
+            self.lengths[elements],
+            self.density[elements] * self.area[elements],
+            lumped
+            )
+
+    def system_loads(self, elements=None):
+        # (n, 4) system loads of all (or chosen) elements
+        if elements is None:
+            elements = slice(None)
+
+        length = self.lengths[elements]
+        linear_load = self.linear_load[elements]
+        loads = np.array(self.end_loads[elements], dtype=float)
+        loads[:, 0] += linear_load*length*0.5
+        loads[:, 1] += linear_load*(length**2)*(1/12)
+        loads[:, 2] += linear_load*length*0.5
+        loads[:, 3] -= linear_load*(length**2)*(1/12)
+
+        return loads
+
+    def subdivide(self, parts):
+        # new mesh with every element divided into given
+        # number (scalar or one per element) of equal elements
+        n = len(self)
+        parts = np.broadcast_to(np.asarray(parts, dtype=int), (n,))
+        index = np.repeat(np.arange(n), parts)
+        last = np.cumsum(parts) - 1
+        first = last - parts + 1
+
+        end_loads = np.zeros([index.size, 4])
+        end_loads[first, :2] = self.end_loads[:, :2]
+        end_loads[last, 2:] = self.end_loads[:, 2:]
+
+        boundaries = np.zeros([index.size, 4], dtype=bool)
+        boundaries[first, :2] = self.boundaries[:, :2]
+        boundaries[last, 2:] = self.boundaries[:, 2:]
+
+        nodes = None
+        if self.nodes is not None:
+            # inner nodes get new identifiers after the largest one
+            inner = np.ones(index.size, dtype=bool)
+            inner[last] = False
+            new = self.nodes.max(initial=-1) + 1 + \
+                np.arange(np.count_nonzero(inner))
+            nodes = np.empty([index.size, 2], dtype=np.int64)
+            nodes[first, 0] = self.nodes[:, 0]
+            nodes[last, 1] = self.nodes[:, 1]
+            nodes[inner, 1] = new
+            nodes[np.flatnonzero(inner) + 1, 0] = new
+
+        mesh = __class__(  # noqa: F821
+            self.lengths[index] / parts[index],
+            end_loads=end_loads,
+            boundaries=boundaries,
+            nodes=nodes
+            )
+        mesh.section = self.section
+        for name in ('youngs_modulus', 'density', 'linear_load') + \
+                self.properties:
+            array = getattr(self, name)
+            if array.strides == (0,):
+                setattr(mesh, name, mesh.broadcast(array[0]))
+            else:
+                setattr(mesh, name, array[index])
+
+        return mesh
+
+    # names of arrays that fully define mesh
+    # (and nodes, when they are given)
+    arrays_names = (
+        'lengths', 'youngs_modulus', 'density', 'linear_load', 'end_loads',
+        'boundaries'
+        ) + properties
+
+    def arrays(self):
+        # arrays of mesh by name, broadcast views as single values
+        arrays = {}
+        for name in self.arrays_names:
+            array = getattr(self, name)
+            if array.ndim == 1 and array.strides == (0,):
+                array = array[0]
+            arrays[name] = array
+        if self.nodes is not None:
+            arrays['nodes'] = self.nodes
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        # mesh of arrays given like by BeamMesh.arrays, arrays are
+        # not copied (read-only ones are copied only when changed)
+        mesh = cls(
+            arrays['lengths'],
+            arrays['youngs_modulus'],
+            linear_load=arrays['linear_load'],
+            end_loads=arrays['end_loads'],
+            boundaries=arrays['boundaries'],
+            density=arrays.get('density', 1),
+            nodes=arrays.get('nodes')
+            )
+        for name in cls.properties:
+            setattr(mesh, name, mesh.broadcast(arrays[name]))
+        return mesh
+
+    @classmethod
+    def from_beams(cls, *beams):
+        beams = tuple(chain.from_iterable(beams))
+
+        mesh = cls(
+            [beam.length for beam in beams],
+            [beam.youngs_modulus for beam in beams],
+            linear_load=[beam.linear_load for beam in beams],
+            end_loads=[
+                [beam.init_force_1, beam.init_moment_1,
+                 beam.init_force_2, beam.init_moment_2]
+                for beam in beams
+                ],
+            boundaries=[beam.boundaries for beam in beams],
+            density=[beam.density for beam in beams]
+            )
+        for name in cls.properties:
+            setattr(mesh, name, np.array(
+                [getattr(beam, name) for beam in beams], dtype=float
+                ))
+
+        return mesh
+
+    @classmethod
+    def discretize(cls, beam, number_of_elements):
+        # same division of beam as easybeam.discretization
+        end_loads = np.zeros([number_of_elements, 4])
+        end_loads[0, :2] = beam.init_force_1, beam.init_moment_1
+        end_loads[-1, 2:] = beam.init_force_2, beam.init_moment_2
+
+        boundaries = np.zeros([number_of_elements, 4], dtype=bool)
+        boundaries[0, :2] = beam.vertical_1, beam.rotation_1
+        boundaries[-1, 2:] = beam.vertical_2, beam.rotation_2
+
+        mesh = cls(
+            np.full(number_of_elements, beam.length / number_of_elements),
+            beam.youngs_modulus,
+            linear_load=beam.linear_load,
+            end_loads=end_loads,
+            boundaries=boundaries,
+            density=beam.density
+            )
+        mesh.section = beam.section
+        for name in cls.properties:
+            setattr(mesh, name, mesh.broadcast(getattr(beam, name)))
+
+        return mesh
+
+
+class BeamResults:
+    # Immutable results of BeamSolver.solve, all arrays are read-only
+    # copies, so results stay valid when solver or beams change.
+    #
+    # displacements          - (n,) or (n, n_cases) global displacements
+    # internal_forces        - (n_elements, 4) or (n_elements, 4, n_cases)
+    # element_displacements  - (n_elements, 4) or (n_elements, 4, n_cases)
+    # element_lengths        - (n_elements,)
+    # element_dofs           - (n_elements, 4) global dofs of elements
+
+    __slots__ = (
+        'displacements', 'internal_forces', 'element_displacements',
+        'element_lengths', 'element_dofs'
+        )
+
+    def __init__(self, **arrays):
+        for name in self.__slots__:
+            array = np.array(arrays[name])
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+
+    def __repr__(self):
+
+        return '{}({} elements, {} load cases)'.format(
+            __class__.__name__,  # noqa: F821
+            self.element_lengths.size,
+            self.cases
+            )
+
+    def __setattr__(self, name, value):
+        raise AttributeError('BeamResults are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('BeamResults are immutable')
+
+    @property
+    def cases(self):
+        return 1 if self.displacements.ndim == 1 else \
+            self.displacements.shape[1]
+
+
+class BeamSolver:
+    # assembly:
+    #   'banded' - global stiffness matrix kept in band storage,
+    #              dense matrix is built only when requested
+    #   'dense'  - global stiffness matrix assembled as full matrix
+    # backend:
+    #   'auto'      - banded Cholesky for narrow band positive definite
+    #                 systems (banded LU if Cholesky fails), dense otherwise
+    #   'dense', 'banded', 'banded_lu', 'sparse' - see easybeam.linalg
+    #   callable    - called as backend(matrix=..., band=...) with one of
+    #                 them given, must return object with solve(rhs) method
+    # profile:
+    #   True        - measurements of every phase are collected
+    #                 in self.report (easybeam.profiling.SolverReport)
+    # callback:
+    #   callable    - called with easybeam.profiling.PhaseRecord
+    #                 after every phase
+    # lazy:
+    #   False       - whole pipeline runs in constructor and results
+    #                 are written into beams (original behaviour)
+    #   True        - nothing is computed until assemble(), factorize()
+    #                 or solve() is called; solve() returns BeamResults
+    #                 and leaves beams untouched
+    # reorder:
+    #   True        - nodes of BeamMesh given with nodes are numbered in
+    #                 reverse Cuthill-McKee order (narrow band for any
+    #                 order of elements), False keeps order of node ids;
+    #                 chained elements are always numbered along chain
+    #
+    # Changes of stiffness or loads of few elements (update() or
+    # assemble() after edits of beams) touch only their 4x4 blocks,
+    # factorization is then corrected with low rank update, until
+    # more than low_rank_limit dofs are modified.
+
+    low_rank_limit = 64
+
+    def __init__(
+        self, *beams, assembly='banded', backend='auto',
+        profile=False, callback=None, lazy=False, reorder=True
+            ):
+        self.report = SolverReport() if profile else None
+        self.callback = callback
+        self.lazy = lazy
+        self.dirty_elements = set()
+        self.__phase_level__ = 0
+        self.__lock__ = RLock()
+        self.__assembled__ = False
+        self.stiffness_factorization = None
+        self.element_mass_matrices = None
+
+        if len(beams) == 1 and isinstance(beams[0], BeamMesh):
+            self.mesh = beams[0]
+            self.beams = self.mesh
+        else:
+            self.mesh = None
+            self.beams = tuple(chain.from_iterable(beams))
+
+        if assembly not in ('banded', 'dense'):
+            raise ValueError(
+                'unknown assembly mode: {}'.format(assembly)
+                )
+        if not (backend == 'auto' or backend in BACKENDS or
+                callable(backend)):
+            raise ValueError(
+                'unknown solver backend: {}'.format(backend)
+                )
+        self.assembly = assembly
+        self.backend = backend
+
+        # global dofs of nodes and elements
+        self.chained = self.mesh is None or self.mesh.nodes is None
+        if self.chained:
+            numbering = chain_numbering(len(self.beams))
+        else:
+            numbering = number_dofs(self.mesh.nodes, reorder)
+        self.node_ids = numbering.node_ids
+        self.node_dofs = numbering.node_dofs
+        self.element_dofs = numbering.element_dofs
+        self.n = numbering.n
+        if self.mesh is not None:
+            self.element_lengths = self.mesh.lengths
+        else:
+            self.element_lengths = np.array(
+                [beam.length for beam in self.beams], dtype=float
+                )
 
-        vectors = [beam.system_loads for beam in self.beams]
+        if not lazy:
+            self.assemble()
+            self.solver()
 
-        self.global_system_loads_vector = np.zeros([self.n])
+    def element_stiffness(self):
+        if self.mesh is not None:
+            return self.mesh.stiffness_matrices()
+        return np.array([beam.stifness_matrix for beam in self.beams])
 
-        for i in range(len(vectors)):
-            current_vector = np.zeros([self.n])
-            current_vector[(0+2*i):(4+2*i)] = vectors[i]
-            self.global_system_loads_vector = \
-                self.global_system_loads_vector + current_vector
+    def element_masses(self, lumped=False):
+        if self.mesh is not None:
+            return self.mesh.mass_matrices(lumped=lumped)
+        return np.array([beam.mass_matrix(lumped) for beam in self.beams])
 
+    def element_boundaries(self):
+        if self.mesh is not None:
+            return self.mesh.boundaries
+        return np.array([beam.boundaries for beam in self.beams])
+
+    def element_loads(self):
+        if self.mesh is not None:
+            return self.mesh.system_loads()
+        return np.array([beam.system_loads for beam in self.beams])
+
+    @phase
+    def assemble(self):
+        # assembly stages, each one is run again
+        # only when data of elements it uses has changed
+
+        with self.__lock__:
+            matrixes = self.element_stiffness()
+            boundaries = self.element_boundaries()
+            loads = self.element_loads()
+
+            if not self.__assembled__:
+                self.internal_agregation(matrixes)
+                self.internal_boundaries(boundaries)
+                self.internal_system_loads(loads)
+                self.apply_boundaries()
+                self.__assembled__ = True
+                return self
+
+            stiffness_changed = np.flatnonzero(
+                (matrixes != self.element_stiffness_matrices).any(axis=(1, 2))
+                )
+            loads_changed = np.flatnonzero(
+                (loads != self.element_system_loads).any(axis=1)
+                )
+            boundaries_changed = not np.array_equal(
+                boundaries, self.element_boundary_flags
+                )
+
+            if stiffness_changed.size > self.low_rank_limit // 4:
+                self.internal_agregation(matrixes)
+            else:
+                self.update_stiffness(
+                    stiffness_changed, matrixes[stiffness_changed]
+                    )
+            if boundaries_changed:
+                self.internal_boundaries(boundaries)
+            self.update_loads(loads_changed, loads[loads_changed])
+
+            if boundaries_changed or \
+                    stiffness_changed.size > self.low_rank_limit // 4:
+                self.apply_boundaries()
+
+        return self
+
+    @phase
+    def internal_agregation(self, matrixes=None):
+
+        if matrixes is None:
+            matrixes = self.element_stiffness()
+        self.element_stiffness_matrices = matrixes
+
+        if self.assembly == 'dense':
+            self.global_stiffness_band = None
+            self.__global_stiffness_matrix__ = assemble_dense(
+                matrixes, self.element_dofs, self.n
+                )
+        else:
+            self.global_stiffness_band = assemble_band(
+                matrixes, self.element_dofs, self.n
+                )
+            self.__global_stiffness_matrix__ = None
+
+    @property
+    def global_stiffness_matrix(self):
+        # dense matrix from band storage is built on first request only
+        if self.__global_stiffness_matrix__ is None:
+            self.__global_stiffness_matrix__ = band_to_dense(
+                self.global_stiffness_band
+                )
+        return self.__global_stiffness_matrix__
+
+    @phase
+    def internal_boundaries(self, vectors=None):
+
+        if vectors is None:
+            vectors = self.element_boundaries()
+        self.element_boundary_flags = np.array(vectors, dtype=bool)
+
+        self.global_boundary_vector = assemble_vector(
+            vectors, self.element_dofs, self.n
+            ) > 0
+
+    @phase
+    def internal_system_loads(self, vectors=None):
+
+        if vectors is None:
+            vectors = self.element_loads()
+        self.element_system_loads = vectors
+
+        self.global_system_loads_vector = assemble_vector(
+            vectors, self.element_dofs, self.n
+            )
+
+    @phase
     def apply_boundaries(self):
 
-        self.boundariezed_stiffness_matrix = self.global_stiffness_matrix
-        self.boundariezed_system_loads_vector = self.global_system_loads_vector
-        self.__solved_vector__ = np.zeros([self.n])
+        # index maps of unconstrained and constrained dofs
+        self.free_dofs = np.flatnonzero(~self.global_boundary_vector)
+        self.fixed_dofs = np.flatnonzero(self.global_boundary_vector)
+        self.reduced_index = np.full(self.n, -1)
+        self.reduced_index[self.free_dofs] = np.arange(self.free_dofs.size)
+
+        if self.global_stiffness_band is not None:
+            self.boundariezed_stiffness_band = reduce_band(
+                self.global_stiffness_band, self.free_dofs
+                )
+            self.__boundariezed_stiffness_matrix__ = None
+        else:
+            self.boundariezed_stiffness_band = None
+            self.__boundariezed_stiffness_matrix__ = \
+                self.global_stiffness_matrix[
+                    np.ix_(self.free_dofs, self.free_dofs)
+                    ]
+
+        self.boundariezed_system_loads_vector = \
+            self.global_system_loads_vector[self.free_dofs]
+
+        # reduced system changed, so old factorization is useless
+        self.stiffness_factorization = None
+
+    @property
+    def boundariezed_stiffness_matrix(self):
+        if self.__boundariezed_stiffness_matrix__ is None:
+            self.__boundariezed_stiffness_matrix__ = band_to_dense(
+                self.boundariezed_stiffness_band
+                )
+        return self.__boundariezed_stiffness_matrix__
+
+    @phase
+    def mass_agregation(self, lumped=False):
+        # global mass matrix assembled like stifness matrix
+        # and reduced to free dofs (assembles stifness first)
 
-        delete_counter = 0
+        with self.__lock__:
+            if not self.__assembled__:
+                self.assemble()
 
-        for i in range(np.size(self.global_boundary_vector, 0)):
-            if self.global_boundary_vector[i]:
-                self.boundariezed_stiffness_matrix = np.delete(
-                    self.boundariezed_stiffness_matrix,
-                    delete_counter,
-                    0
+            matrixes = self.element_masses(lumped)
+            self.element_mass_matrices = matrixes
+            self.lumped_mass = lumped
+
+            if self.assembly == 'dense':
+                self.global_mass_band = None
+                self.boundariezed_mass_band = None
+                self.__global_mass_matrix__ = assemble_dense(
+                    matrixes, self.element_dofs, self.n
                     )
-                self.boundariezed_stiffness_matrix = np.delete(
-                    self.boundariezed_stiffness_matrix,
-                    delete_counter,
-                    1
+                self.__boundariezed_mass_matrix__ = \
+                    self.__global_mass_matrix__[
+                        np.ix_(self.free_dofs, self.free_dofs)
+                        ]
+            else:
+                self.global_mass_band = assemble_band(
+                    matrixes, self.element_dofs, self.n
                     )
-                self.boundariezed_system_loads_vector = np.delete(
-                    self.boundariezed_system_loads_vector,
-                    delete_counter
+                self.boundariezed_mass_band = reduce_band(
+                    self.global_mass_band, self.free_dofs
                     )
-            else:
-                delete_counter += 1
-                self.__solved_vector__[i] = True
+                self.__global_mass_matrix__ = None
+                self.__boundariezed_mass_matrix__ = None
+
+        return self
+
+    @property
+    def global_mass_matrix(self):
+        if self.element_mass_matrices is None:
+            self.mass_agregation()
+        if self.__global_mass_matrix__ is None:
+            self.__global_mass_matrix__ = band_to_dense(
+                self.global_mass_band
+                )
+        return self.__global_mass_matrix__
+
+    @property
+    def boundariezed_mass_matrix(self):
+        if self.element_mass_matrices is None:
+            self.mass_agregation()
+        if self.__boundariezed_mass_matrix__ is None:
+            self.__boundariezed_mass_matrix__ = band_to_dense(
+                self.boundariezed_mass_band
+                )
+        return self.__boundariezed_mass_matrix__
+
+    def reduced_width(self):
+        # upper bandwidth of matrices reduced to free dofs, from
+        # dofs of elements, so it does not depend on values
+        reduced = self.reduced_index[self.element_dofs]
+        kept = reduced >= 0
+        width = np.where(kept, reduced, -1).max(axis=1) - \
+            np.where(kept, reduced, self.n).min(axis=1)
+        return int(max(width.max(initial=0), 0))
+
+    def reduced_band(self, name='stiffness'):
+        '''
+        band storage of boundariezed stifness or mass matrix
+        (name 'stiffness' or 'mass'), all of them with the same
+        width, so they may be added together
+        '''
+        if name == 'mass' and self.element_mass_matrices is None:
+            self.mass_agregation()
+        width = self.reduced_width()
+        band = getattr(self, 'boundariezed_{}_band'.format(name))
+        if band is None:
+            return dense_to_band(
+                getattr(self, 'boundariezed_{}_matrix'.format(name)), width
+                )
+        if band.shape[0] > width + 1:
+            # rows above width hold structural zeros only
+            return band[band.shape[0] - width - 1:]
+        return np.concatenate(
+            [np.zeros([width + 1 - band.shape[0], band.shape[1]]), band]
+            )
 
+    @phase
+    def factorize(self):
+        # factorization of boundariezed stiffness matrix by chosen backend,
+        # computed once and kept for following solutions
+
+        with self.__lock__:
+            if not self.__assembled__:
+                self.assemble()
+            if self.stiffness_factorization is None:
+                self.stiffness_factorization = self.backend_factorization()
+            return self.stiffness_factorization
+
+    def backend_factorization(self):
+
+        band = self.boundariezed_stiffness_band
+        if band is None:
+            system = {'matrix': self.boundariezed_stiffness_matrix}
+            size, width = system['matrix'].shape[0], None
+        else:
+            system = {'band': band}
+            size, width = band.shape[1], band.shape[0] - 1
+
+        if callable(self.backend):
+            return self.backend(**system)
+
+        name = self.backend
+        if name == 'auto':
+            name = choose_backend(size, width)
+            if name == 'banded':
+                try:
+                    return BandedCholesky(**system)
+                except lp.LinAlgError:
+                    name = 'banded_lu'
+
+        return BACKENDS[name](**system)
+
+    @phase
     def solver(self):
-        self.unknowns_solved = lp.solve(
-            self.boundariezed_stiffness_matrix,
-            self.boundariezed_system_loads_vector
+        with self.__lock__:
+            self.unknowns_solved = self.factorize().solve(
+                self.boundariezed_system_loads_vector
+                )
+            self.global_solvings_vector = np.zeros([self.n])
+            self.global_solvings_vector[self.free_dofs] = \
+                self.unknowns_solved
+
+            # internal forces of all elements at once, (n_elements, 4)
+            self.element_displacements = \
+                self.global_solvings_vector[self.element_dofs]
+            self.internal_forces_matrix = self.element_forces(
+                self.global_solvings_vector, self.element_system_loads
+                )
+
+            if self.mesh is not None:
+                self.mesh.displacements = self.element_displacements
+                self.mesh.internal_forces = self.internal_forces_matrix
+                return
+
+            # beams get views of rows, nothing is computed per element
+            for counter, beam_element in enumerate(self.beams):
+                beam_element.__solved_forces__ = \
+                    self.element_displacements[counter]
+                beam_element.internal_forces_array = \
+                    self.internal_forces_matrix[counter]
+
+    @property
+    def node_displacements(self):
+        # (n_nodes, 2) deflections and rotations of nodes of node_ids
+        return self.global_solvings_vector[self.node_dofs]
+
+    def element_forces(self, displacements, element_loads, elements=None):
+        '''
+        internal forces of elements for global displacements
+        (n,) or (n, n_cases) and element system loads (n_elements, 4)
+        or (n_elements, 4, n_cases), elements selects subset (slice or
+        index array) of elements
+        '''
+        if elements is None:
+            elements = slice(None)
+
+        return np.einsum(
+            'eij,ej...->ei...',
+            self.element_stiffness_matrices[elements],
+            displacements[self.element_dofs[elements]]
+            ) - element_loads[elements]
+
+    @phase
+    def solve_load_cases(self, loads=None, element_loads=None):
+        '''
+        solution of many load cases with one factorization
+
+        loads         - (n, n_cases) nodal loads in global dofs
+        element_loads - (n_elements, 4, n_cases) element system loads,
+                        same meaning as Beam.system_loads
+
+        returns (n, n_cases) displacements and
+        (n_elements, 4, n_cases) internal forces
+        '''
+        if loads is None and element_loads is None:
+            raise No_Data
+
+        with self.__lock__:
+            factorization = self.factorize()
+
+            if element_loads is None:
+                element_loads = np.zeros([len(self.beams), 4, 1])
+            else:
+                element_loads = np.asarray(element_loads, dtype=float)
+
+            if loads is None:
+                loads = np.zeros([self.n, element_loads.shape[2]])
+            else:
+                loads = np.asarray(loads, dtype=float).reshape(self.n, -1)
+
+            n_cases = max(loads.shape[1], element_loads.shape[2])
+            global_loads = np.broadcast_to(loads, (self.n, n_cases)).copy()
+            for dof in range(4):
+                np.add.at(
+                    global_loads, self.element_dofs[:, dof],
+                    element_loads[:, dof, :]
+                    )
+
+            displacements = np.zeros([self.n, n_cases])
+            displacements[self.free_dofs] = factorization.solve(
+                global_loads[self.free_dofs]
+                )
+
+            return displacements, self.element_forces(
+                displacements, element_loads
+                )
+
+    def mark_dirty(self, *elements):
+        # indexes of elements changed since last update
+        self.dirty_elements.update(int(element) for element in elements)
+
+    @phase
+    def update(self, *elements):
+        '''
+        refresh after stiffness or loads of given (and marked dirty)
+        elements were changed, e.g. with Beam.section and
+        Beam.stifness or Beam.loads; only blocks of these elements are
+        assembled again and factorization gets low rank update,
+        eager solver solves again and writes results into beams
+        '''
+        with self.__lock__:
+            if not self.__assembled__:
+                self.assemble()
+            self.mark_dirty(*elements)
+            elements = np.array(sorted(self.dirty_elements), dtype=int)
+            self.dirty_elements.clear()
+
+            if self.mesh is not None:
+                matrixes = self.mesh.stiffness_matrices(elements)
+                loads = self.mesh.system_loads(elements)
+            else:
+                matrixes = np.array([
+                    self.beams[element].stifness_matrix
+                    for element in elements
+                    ]).reshape(-1, 4, 4)
+                loads = np.array([
+                    self.beams[element].system_loads
+                    for element in elements
+                    ]).reshape(-1, 4)
+
+            self.update_stiffness(elements, matrixes)
+            self.update_loads(elements, loads)
+
+        if not self.lazy:
+            self.solver()
+
+    def update_stiffness(self, elements, matrixes):
+        # in place change of stifness matrices of few elements
+
+        delta = matrixes - self.element_stiffness_matrices[elements]
+        changed = np.abs(delta).max(axis=(1, 2)) > 0
+        elements, delta = elements[changed], delta[changed]
+        if not elements.size:
+            return
+        self.element_stiffness_matrices[elements] = matrixes[changed]
+
+        dofs = self.element_dofs[elements]
+        reduced = self.reduced_index[dofs]
+
+        if self.global_stiffness_band is not None:
+            add_to_band(self.global_stiffness_band, delta, dofs)
+            add_to_band(self.boundariezed_stiffness_band, delta, reduced)
+            self.__global_stiffness_matrix__ = None
+            self.__boundariezed_stiffness_matrix__ = None
+        else:
+            for matrix, indexes in (
+                (self.__global_stiffness_matrix__, dofs),
+                (self.__boundariezed_stiffness_matrix__, reduced)
+                    ):
+                rows = np.broadcast_to(indexes[:, :, np.newaxis], delta.shape)
+                cols = np.broadcast_to(indexes[:, np.newaxis, :], delta.shape)
+                kept = (rows >= 0) & (cols >= 0)
+                np.add.at(matrix, (rows[kept], cols[kept]), delta[kept])
+
+        factorization = self.stiffness_factorization
+        if factorization is None:
+            return
+        if not isinstance(factorization, LowRankUpdate):
+            factorization = LowRankUpdate(factorization)
+
+        # change of reduced system in rows and columns of touched dofs
+        rows = np.broadcast_to(reduced[:, :, np.newaxis], delta.shape)
+        cols = np.broadcast_to(reduced[:, np.newaxis, :], delta.shape)
+        kept = (rows >= 0) & (cols >= 0)
+        touched = np.unique(reduced[reduced >= 0])
+        local = np.full(self.free_dofs.size, -1)
+        local[touched] = np.arange(touched.size)
+        block = np.zeros([touched.size, touched.size])
+        np.add.at(
+            block, (local[rows[kept]], local[cols[kept]]), delta[kept]
+            )
+
+        if np.union1d(factorization.dofs, touched).size > \
+                self.low_rank_limit:
+            self.stiffness_factorization = None
+        else:
+            factorization.update(touched, block)
+            self.stiffness_factorization = factorization
+
+    def update_loads(self, elements, loads):
+        # in place change of system loads of few elements
+
+        delta = loads - self.element_system_loads[elements]
+        self.element_system_loads[elements] = loads
+        np.add.at(
+            self.global_system_loads_vector,
+            self.element_dofs[elements], delta
             )
-        self.global_solvings_vector = np.zeros([self.n])
-
-        unknowns_counter = 0
-        for i in range(len(self.__solved_vector__)):
-            if self.__solved_vector__[i]:
-                self.global_solvings_vector[i] = \
-                    self.unknowns_solved[unknowns_counter]
-                unknowns_counter += 1
-
-        for counter, beam_element in enumerate(self.beams):
-            beam_element.internal_forces(
-                self.global_solvings_vector[(0+2*counter):(4+2*counter)]
+        self.boundariezed_system_loads_vector = \
+            self.global_system_loads_vector[self.free_dofs]
+
+    @phase
+    def solve(self, loads=None, element_loads=None):
+        '''
+        staged solution: assembly and factorization are
+        refreshed if elements have changed, then system is solved for
+        loads of elements, or for given loads (same meaning as in
+        solve_load_cases); beams are not changed
+
+        returns immutable BeamResults
+        '''
+        # whole solution holds lock: edits by other threads change
+        # loads, boundaries and factorization in place
+        with self.__lock__:
+            self.assemble()
+            self.factorize()
+
+            if loads is None and element_loads is None:
+                displacements, internal_forces = self.solve_load_cases(
+                    element_loads=self.element_system_loads[:, :, np.newaxis]
+                    )
+                displacements = displacements[:, 0]
+                internal_forces = internal_forces[:, :, 0]
+            else:
+                displacements, internal_forces = self.solve_load_cases(
+                    loads, element_loads
+                    )
+
+            return BeamResults(
+                displacements=displacements,
+                internal_forces=internal_forces,
+                element_displacements=displacements[self.element_dofs],
+                element_lengths=self.element_lengths,
+                element_dofs=self.element_dofs
                 )
 
     def results(self):
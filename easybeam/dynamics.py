@@ -0,0 +1,148 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem dynamics tools
+=============================================================================
+time_history        Generator of dynamic response of beams to load history,
+                    Newmark-beta or HHT-alpha implicit integration
+TimeStep            Response at single time step
+=================== ==========================================================
+
+Equation of motion of free dofs, in HHT-alpha form (alpha = 0 gives
+Newmark-beta):
+
+    M a1 + (1+alpha) (C v1 + K u1) - alpha (C v0 + K u0)
+        = (1+alpha) f1 - alpha f0
+
+with Rayleigh damping C = mass_damping*M + stiffness_damping*K. With
+constant time step effective stiffness M/(beta dt^2) + (1+alpha) (gamma
+C/(beta dt) + K) does not change, so it is factorized once in band
+storage and every step costs few band products and one solution.
+Results are yielded step after step and nothing is kept, so memory does
+not grow with number of steps.
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import numpy.linalg as lp
+
+from easyfem.easybeam.linalg import (
+    BandedCholesky, BandedLU, DenseLU, band_matvec
+)
+
+TimeStep = namedtuple(
+    'TimeStep',
+    [
+        'time',             # unit: s
+        'displacements',    # (n,) global displacements
+        'velocities',       # (n,)
+        'accelerations',    # (n,)
+        'internal_forces',  # (n_elements, 4) end forces of elements,
+                            # including inertia and damping
+    ]
+)
+
+
+def _factorize(band):
+    # effective stiffness and mass are positive definite,
+    # LU is left for badly posed systems
+    try:
+        return BandedCholesky(band=band)
+    except ImportError:
+        return DenseLU(band=band)
+    except lp.LinAlgError:
+        return BandedLU(band=band)
+
+
+def time_history(
+    solver, loads, time_step, alpha=0.0, beta=None, gamma=None,
+    mass_damping=0.0, stiffness_damping=0.0, lumped=False,
+    displacements=None, velocities=None
+        ):
+    '''
+    generator of TimeStep of every time of load history
+
+    loads              - (n_steps + 1, n) array or iterable of (n,)
+                         global load vectors, first one at time 0
+    time_step          - constant time step, unit: s
+    alpha              - HHT parameter in [-1/3, 0], 0 gives Newmark
+    beta, gamma        - Newmark parameters, by default (1-alpha)^2/4
+                         and 1/2-alpha (unconditionally stable, average
+                         acceleration for alpha = 0)
+    mass_damping,
+    stiffness_damping  - Rayleigh damping coefficients
+    lumped             - lumped mass matrix instead of consistent one
+    displacements,
+    velocities         - (n,) initial state, zero by default
+    '''
+    if not -1/3 <= alpha <= 0:
+        raise ValueError('HHT alpha must lie in [-1/3, 0]')
+    beta = (1 - alpha)**2 / 4 if beta is None else beta
+    gamma = 0.5 - alpha if gamma is None else gamma
+
+    solver.mass_agregation(lumped)
+    stiffness = solver.reduced_band('stiffness')
+    mass = solver.reduced_band('mass')
+    damping = mass_damping*mass + stiffness_damping*stiffness
+    free = solver.free_dofs
+    dofs = solver.element_dofs
+    element_stiffness = solver.element_stiffness_matrices
+    element_mass = solver.element_mass_matrices
+
+    dt = time_step
+    c0 = 1 / (beta * dt**2)
+    c1 = gamma / (beta * dt)
+    c2 = 1 / (beta * dt)
+    c3 = 1 / (2*beta) - 1
+    c4 = 1 - gamma / beta
+    c5 = dt * (1 - gamma / (2*beta))
+
+    effective = _factorize(
+        c0*mass + (1 + alpha)*(c1*damping + stiffness)
+        )
+
+    def state(vector):
+        return np.zeros(free.size) if vector is None else \
+            np.asarray(vector, dtype=float)[free]
+
+    def step(time, u, v, a):
+        full = np.zeros([3, solver.n])
+        full[:, free] = u, v, a
+        # end forces: K u + C v + M a of every element
+        forces = np.einsum(
+            'eij,ej->ei', element_stiffness,
+            full[0][dofs] + stiffness_damping*full[1][dofs]
+            ) + np.einsum(
+            'eij,ej->ei', element_mass,
+            full[2][dofs] + mass_damping*full[1][dofs]
+            )
+        return TimeStep(time, full[0], full[1], full[2], forces)
+
+    loads = iter(loads)
+    force = np.asarray(next(loads), dtype=float)[free]
+    u, v = state(displacements), state(velocities)
+    a = _factorize(mass).solve(
+        force - band_matvec(damping, v) - band_matvec(stiffness, u)
+        )
+    yield step(0.0, u, v, a)
+
+    for number, next_force in enumerate(loads, start=1):
+        next_force = np.asarray(next_force, dtype=float)[free]
+
+        rhs = (1 + alpha)*next_force - alpha*force \
+            - band_matvec(stiffness, u) \
+            + band_matvec(mass, c2*v + c3*a) \
+            - band_matvec(damping, (1 + alpha)*(c4*v + c5*a) - alpha*v)
+        increment = effective.solve(rhs)
+
+        next_a = c0*increment - c2*v - c3*a
+        v = c1*increment + c4*v + c5*a
+        u = u + increment
+        a = next_a
+        force = next_force
+
+        yield step(number*dt, u, v, a)
@@ -0,0 +1,115 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem export tools
+=============================================================================
+results_chunks      Generator of results columns in chunks of elements
+export_npz          Streaming export of results to .npz file, one
+                    column after another
+=================== ==========================================================
+
+Columns are the same as fields of results_array: coordinates (x),
+bending moments (M), shear forces (T), displacements (d) and rotations
+(r), with values at both ends of every element. Only one chunk of one
+column is held in memory at a time, file written by export_npz is read
+with numpy.load.
+
+"""
+
+import zipfile
+
+import numpy as np
+import numpy.lib.format as npy
+
+from easyfem.easybeam.funcs import (
+    RESULTS_DTYPE, check_chained, element_results, ends_values
+)
+
+# number of elements in one chunk
+CHUNK_SIZE = 65536
+
+
+def _column(name, lengths, internal_forces, displacements, offset):
+    # values at ends of elements in chunk, offset is coordinate
+    # of start of chunk (cumulative sum is continued exactly)
+    if name == 'x':
+        coordinates = np.cumsum(np.concatenate([[offset], lengths]))
+        return ends_values(coordinates[:-1], coordinates[1:])
+    if name == 'M':
+        return ends_values(internal_forces[:, 1], -internal_forces[:, 3])
+    if name == 'T':
+        return ends_values(internal_forces[:, 0], -internal_forces[:, 2])
+    if name == 'd':
+        return ends_values(displacements[:, 0], displacements[:, 2])
+    if name == 'r':
+        return ends_values(displacements[:, 1], displacements[:, 3])
+    raise KeyError('unknown results column {!r}'.format(name))
+
+
+def _results_chunks(
+    lengths, internal_forces, displacements, chunk_size, columns, dtype
+        ):
+    for name in columns:
+        offset = 0.0
+        for start in range(0, lengths.size, chunk_size):
+            stop = start + chunk_size
+            values = _column(
+                name,
+                lengths[start:stop],
+                internal_forces[start:stop],
+                displacements[start:stop],
+                offset
+                )
+            if name == 'x':
+                offset = values[-1]
+            yield name, values.astype(dtype, copy=False)
+
+
+def results_chunks(
+    *beams, chunk_size=CHUNK_SIZE, columns=RESULTS_DTYPE.names, dtype=float
+        ):
+    '''
+    generator of (column name, values) pairs, column after column,
+    every values array covers chunk_size elements (2*chunk_size rows)
+
+    beams are given like for results_array
+    '''
+    if 'x' in columns:
+        check_chained(*beams)
+    return _results_chunks(
+        *element_results(*beams), chunk_size, columns, dtype
+        )
+
+
+def export_npz(
+    path, *beams, chunk_size=CHUNK_SIZE, columns=RESULTS_DTYPE.names,
+    dtype=float, compress=False
+        ):
+    '''
+    writes results columns to .npz file without building whole columns
+
+    dtype     - type of saved values, e.g. numpy.float32 halves file
+    compress  - deflate members like numpy.savez_compressed
+    '''
+    if 'x' in columns:
+        check_chained(*beams)
+    arrays = element_results(*beams)
+    lengths, internal_forces = arrays[:2]
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+
+    with zipfile.ZipFile(path, 'w', compression, allowZip64=True) as archive:
+        for name in columns:
+            # coordinates do not depend on load cases
+            cases = () if name == 'x' else internal_forces.shape[2:]
+            with archive.open(name + '.npy', 'w', force_zip64=True) as member:
+                npy.write_array_header_1_0(member, {
+                    'descr': npy.dtype_to_descr(np.dtype(dtype)),
+                    'fortran_order': False,
+                    'shape': (2*lengths.size,) + cases,
+                })
+                for _, values in _results_chunks(
+                        *arrays, chunk_size, (name,), dtype
+                        ):
+                    member.write(np.ascontiguousarray(values).tobytes())
@@ -6,7 +6,16 @@ easyfem Analysis Tools
 easyfem funcs tools
 =============================================================================
 discertization      Optional discretization tool. By discretization you can
-                    acquire precise results.
+                    acquire precise results. With mesh=True returns
+                    BeamMesh, which is much lighter for large number
+                    of elements.
+adaptive_discretization
+                    Discretization refined only where results of coarse
+                    discretization are not accurate enough
+discretization_errors
+                    Relative error estimates of elements of solved mesh
+refine              Solved mesh with chosen elements split in half,
+                    without solving whole system again
 coordinates_array   Tool for creating array with coordinates of beams in tuple
 moments_array       Tool for creating array with values of bending moments
                     of beams in tuple
@@ -16,13 +25,29 @@ disps_array         Tool for creating array with values of displacments
                     of beams in tuple
 rotations_array     Tool for creating array with values of rotational angles
                     of beams in tuple
+results_array       Tool for creating structured array with all of above
+                    values at once
+element_results     Tool for gathering arrays of lengths, internal forces
+                    and displacements of solved elements
+check_chained       Raises ValueError for models with elements connected
+                    by nodes, whose coordinates are not known
 =================== ==========================================================
 
+All *_array tools accept beams in tuples, or BeamSolver, BeamResults
+or BeamMesh itself; in the latter case arrays stored by solver are used
+directly. Coordinates are sums of lengths in order of elements, so
+tools giving them need elements chained end to end.
+
 """
 
+import warnings
+
 import numpy as np
 from itertools import chain
-from easyfem.easybeam.classes import Beam
+from easyfem.easybeam.classes import (
+    Beam, BeamMesh, BeamSolver, BeamResults
+)
+from easyfem.easybeam.linalg import chain_dofs
 
 # My very first FEM solver program
 # Author's name: Beniamin Dudek
@@ -30,7 +55,10 @@ from easyfem.easybeam.classes import Beam
 # field of studies: Civil Engineering
 
 
-def discretization(beam, number_of_elements):
+def discretization(beam, number_of_elements, mesh=False):
+    if mesh:
+        return BeamMesh.discretize(beam, number_of_elements)
+
     digitized_beam = []
     length_of_element = beam.length / number_of_elements
 
@@ -39,7 +67,8 @@ def discretization(beam, number_of_elements):
         current_beam = Beam(
             length_of_element,
             beam.youngs_modulus,
-            beam.section
+            beam.section,
+            beam.density
             )
 
         # declaring boundaries and loads for each element
@@ -76,23 +105,199 @@ def discretization(beam, number_of_elements):
     return tuple(digitized_beam)
 
 
+class Not_Converged(RuntimeWarning):
+    pass
+
+
+def discretization_errors(mesh, floor=0.1):
+    '''
+    relative error estimates of solved elements of BeamMesh
+
+    Hermite beam elements with consistent loads give exact
+    nodal values, so error lies between nodes, where result diagrams
+    join end values of elements with straight lines. Within element
+    with distributed load q bending moment is a parabola (largest
+    difference qL^2/8) and displacement a quartic, whose middle
+    differs from straight line by L(r1-r2)/8 + qL^4/(384EI) (r1, r2
+    are end rotations). Differences are compared with values at ends
+    of element, but not with less than floor times largest estimated
+    absolute value of whole model, so elements with small results
+    (e.g. near supports) get relatively finer division.
+    '''
+    lengths = mesh.lengths
+    linear_load = mesh.linear_load
+    displacements = mesh.displacements
+    moments = np.abs(mesh.internal_forces[:, [1, 3]]).max(axis=1)
+    deflections = np.abs(displacements[:, [0, 2]]).max(axis=1)
+
+    moment_error = np.abs(linear_load) * lengths**2 / 8
+    disp_error = np.abs(
+        lengths * (displacements[:, 1] - displacements[:, 3]) / 8 +
+        linear_load * lengths**4 / (
+            384 * mesh.youngs_modulus * mesh.moment_of_inertia_z
+            )
+        )
+
+    # largest values between nodes are estimated by ends plus errors
+    tiny = np.finfo(float).tiny
+    moment_scale = np.maximum(
+        moments, max(floor*(moments + moment_error).max(), tiny)
+        )
+    disp_scale = np.maximum(
+        deflections, max(floor*(deflections + disp_error).max(), tiny)
+        )
+
+    return np.maximum(moment_error / moment_scale, disp_error / disp_scale)
+
+
+def refine(mesh, marked):
+    '''
+    solved BeamMesh with marked elements of solved mesh split in
+    half, without solving whole system again: nodal values stay
+    exact, values at new middle nodes come from exact solution
+    of element under its end displacements and uniform load
+    '''
+    parts = 1 + np.asarray(marked, dtype=int)
+    refined = mesh.subdivide(parts)
+    index = np.repeat(np.arange(len(mesh)), parts)
+    displacements = np.array(mesh.displacements[index], dtype=float)
+
+    split = parts == 2
+    length = mesh.lengths[split]
+    deflection_1, rotation_1, deflection_2, rotation_2 = \
+        mesh.displacements[split].T
+    rigidity = mesh.youngs_modulus[split] * mesh.moment_of_inertia_z[split]
+    middle = np.stack([
+        (deflection_1 + deflection_2) / 2 +
+        length * (rotation_1 - rotation_2) / 8 +
+        mesh.linear_load[split] * length**4 / (384 * rigidity),
+        1.5 * (deflection_2 - deflection_1) / length -
+        (rotation_1 + rotation_2) / 4
+        ], axis=1)
+
+    last = np.cumsum(parts) - 1
+    displacements[last[split] - 1, 2:] = middle
+    displacements[last[split], :2] = middle
+
+    refined.displacements = displacements
+    refined.internal_forces = np.einsum(
+        'eij,ej->ei', refined.stiffness_matrices(), displacements
+        ) - refined.system_loads()
+
+    return refined
+
+
+def adaptive_discretization(
+    beams, tolerance=0.01, max_elements=1000000, max_iterations=50,
+    floor=0.1
+        ):
+    '''
+    discretization that starts from given beams and splits in half
+    only elements with estimated error (see discretization_errors)
+    above tolerance, until all errors are below tolerance, returns
+    solved BeamMesh
+
+    system is solved once, refined meshes are solved incrementally
+    by refine; Not_Converged is warned when max_elements or
+    max_iterations stop refinement before tolerance is met
+    '''
+    if isinstance(beams, BeamMesh):
+        # copy that keeps nodes of elements
+        mesh = beams.subdivide(1)
+    else:
+        if isinstance(beams, Beam):
+            beams = (beams,)
+        mesh = BeamMesh.from_beams(beams)
+    BeamSolver(mesh)
+
+    for iteration in range(max_iterations + 1):
+        marked = discretization_errors(mesh, floor) > tolerance
+        if not marked.any():
+            return mesh
+        if iteration == max_iterations or \
+                len(mesh) + marked.sum() > max_elements:
+            break
+        mesh = refine(mesh, marked)
+
+    warnings.warn(
+        'adaptive discretization stopped with {} of {} elements above '
+        'tolerance'.format(int(marked.sum()), len(mesh)),
+        Not_Converged
+        )
+    return mesh
+
+
+def element_results(*beams):
+    '''
+    arrays with lengths (n,), internal forces (n, 4)
+    and displacements (n, 4) of solved elements,
+    taken straight from BeamSolver, BeamResults
+    or BeamMesh if given
+    '''
+    if len(beams) == 1 and isinstance(beams[0], BeamSolver):
+        solver = beams[0]
+        return (
+            solver.element_lengths,
+            solver.internal_forces_matrix,
+            solver.element_displacements
+            )
+
+    if len(beams) == 1 and isinstance(beams[0], BeamResults):
+        results = beams[0]
+        return (
+            results.element_lengths,
+            results.internal_forces,
+            results.element_displacements
+            )
+
+    if len(beams) == 1 and isinstance(beams[0], BeamMesh):
+        mesh = beams[0]
+        return mesh.lengths, mesh.internal_forces, mesh.displacements
+
+    beams = tuple(chain.from_iterable(beams))
+
+    return (
+        np.array([beam.length for beam in beams], dtype=float),
+        np.array([beam.internal_forces_array for beam in beams]),
+        np.array([beam.solve() for beam in beams])
+        )
+
+
+def check_chained(*beams):
+    '''
+    raises ValueError when beams (given like for element_results)
+    are connected by nodes instead of chained end to end
+    '''
+    if len(beams) != 1:
+        return
+    model = beams[0]
+    if isinstance(model, BeamSolver):
+        chained = model.chained
+    elif isinstance(model, BeamMesh):
+        chained = model.nodes is None
+    elif isinstance(model, BeamResults):
+        dofs = model.element_dofs
+        chained = np.array_equal(dofs, chain_dofs(dofs.shape[0]))
+    else:
+        return
+    if not chained:
+        raise ValueError('coordinates need elements chained end to end')
+
+
+def ends_values(start, end):
+    # values at both ends of every element, one after another
+    # (extra dimension of many load cases is kept)
+    return np.stack([start, end], axis=1).reshape(-1, *start.shape[1:])
+
+
 def momments_array(*beams):
     '''
     fucntions for crating arrays with
     values of bending moments
     '''
-    beams = tuple(chain.from_iterable(beams))
-
-    moments_array = []
-    for beam in beams:
-        moments = [
-            beam.internal_forces_array[1],
-            -1*beam.internal_forces_array[3]
-            ]
-        for moment in moments:
-            moments_array.append(moment)
+    internal_forces = element_results(*beams)[1]
 
-    return np.array(moments_array)
+    return ends_values(internal_forces[:, 1], -1*internal_forces[:, 3])
 
 
 def shears_array(*beams):
@@ -100,18 +305,9 @@ def shears_array(*beams):
     fucntions for crating arrays with
     values of shear forces
     '''
-    beams = tuple(chain.from_iterable(beams))
-
-    shears_array = []
-    for beam in beams:
-        shears = [
-            beam.internal_forces_array[0],
-            -1*beam.internal_forces_array[2]
-            ]
-        for shear in shears:
-            shears_array.append(shear)
+    internal_forces = element_results(*beams)[1]
 
-    return np.array(shears_array)
+    return ends_values(internal_forces[:, 0], -1*internal_forces[:, 2])
 
 
 def disps_array(*beams):
@@ -119,15 +315,9 @@ def disps_array(*beams):
     fucntions for crating arrays with
     values of displacemnets
     '''
-    beams = tuple(chain.from_iterable(beams))
-
-    disps_array = []
-    for beam in beams:
-        disps = [beam.solve()[0], beam.solve()[2]]
-        for disp in disps:
-            disps_array.append(disp)
+    displacements = element_results(*beams)[2]
 
-    return np.array(disps_array)
+    return ends_values(displacements[:, 0], displacements[:, 2])
 
 
 def rotations_array(*beams):
@@ -135,15 +325,9 @@ def rotations_array(*beams):
     fucntions for crating arrays with
     values of rotations
     '''
-    beams = tuple(chain.from_iterable(beams))
-
-    rot_array = []
-    for beam in beams:
-        rots = [beam.solve()[1], beam.solve()[3]]
-        for rot in rots:
-            rot_array.append(rot)
+    displacements = element_results(*beams)[2]
 
-    return np.array(rot_array)
+    return ends_values(displacements[:, 1], displacements[:, 3])
 
 
 def coordinates_array(*beams):
@@ -151,13 +335,53 @@ def coordinates_array(*beams):
     fucntions for crating arrays with
     values of coordinates
     '''
-    beams = tuple(chain.from_iterable(beams))
-    coordinates_array = []
+    check_chained(*beams)
+    if len(beams) == 1 and \
+            isinstance(beams[0], (BeamSolver, BeamResults, BeamMesh)):
+        lengths = element_results(*beams)[0]
+    else:
+        lengths = np.array(
+            [beam.length for beam in chain.from_iterable(beams)],
+            dtype=float
+            )
+
+    ends = np.cumsum(lengths)
+    starts = np.concatenate([[0.0], ends[:-1]])
+
+    return ends_values(starts, ends)
+
+
+RESULTS_DTYPE = np.dtype([
+    ('x', float), ('M', float), ('T', float), ('d', float), ('r', float)
+    ])
+
+
+def results_array(*beams):
+    '''
+    fucntions for crating structured array with
+    coordinates (x), bending moments (M), shear forces (T),
+    displacements (d) and rotations (r) in one pass;
+    for results of many load cases fields other than x
+    have (n_cases,) subshape
+    '''
+    check_chained(*beams)
+    lengths, internal_forces, displacements = element_results(*beams)
+
+    ends = np.cumsum(lengths)
+    starts = np.concatenate([[0.0], ends[:-1]])
+
+    dtype = RESULTS_DTYPE
+    cases = internal_forces.shape[2:]
+    if cases:
+        dtype = np.dtype([('x', float)] + [
+            (name, float, cases) for name in RESULTS_DTYPE.names[1:]
+            ])
 
-    current_length = 0
-    for beam in beams:
-        coordinates_array.append(current_length)
-        current_length = current_length + beam.length
-        coordinates_array.append(current_length)
+    results = np.empty(2*lengths.size, dtype=dtype)
+    results['x'] = ends_values(starts, ends)
+    results['M'] = ends_values(internal_forces[:, 1], -internal_forces[:, 3])
+    results['T'] = ends_values(internal_forces[:, 0], -internal_forces[:, 2])
+    results['d'] = ends_values(displacements[:, 0], displacements[:, 2])
+    results['r'] = ends_values(displacements[:, 1], displacements[:, 3])
 
-    return np.array(coordinates_array)
+    return results
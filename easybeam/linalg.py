@@ -0,0 +1,462 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem linalg tools
+=============================================================================
+chain_dofs          Global degrees of freedom of beam elements chained
+                    end to end
+band_width          Upper bandwidth of global matrix built from elements
+assemble_band       Assembly of element matrices straight into symmetric
+                    LAPACK band storage (upper form)
+assemble_dense      Assembly of element matrices into full global matrix
+assemble_vector     Assembly of element vectors into global vector
+add_to_band         In place addition of few element matrices to band storage
+band_to_dense       Conversion of band storage into full symmetric matrix
+band_matvec         Product of symmetric matrix given by band storage
+                    and vector
+band_norm           1-norm of symmetric matrix given by band storage
+dense_to_band       Conversion of full symmetric matrix into band storage
+reduce_band         Band storage of matrix with chosen rows and columns only
+DenseLU             Dense LU solver backend
+BandedCholesky      Banded Cholesky solver backend (symmetric positive
+                    definite systems)
+BandedLU            Banded LU solver backend
+SparseLU            Sparse direct solver backend
+LowRankUpdate       Factorization of matrix changed in few rows and columns
+                    since it was factorized (Sherman-Morrison-Woodbury)
+choose_backend      Automatic choice of solver backend
+=================== ==========================================================
+
+Band storage follows LAPACK convention for symmetric matrices given by
+upper triangle: element a[i, j] with i <= j is kept in
+band[width + i - j, j].
+
+Solver backends are created with full matrix or band storage of the
+system (whichever is at hand) and solve it by calling solve(rhs).
+condition() gives cheap estimate of 1-norm condition number computed
+with factors.
+Banded and sparse backends need scipy.
+
+"""
+
+import numpy as np
+import numpy.linalg as lp
+
+try:
+    import scipy.linalg as sl
+    import scipy.sparse as sp
+    import scipy.sparse.linalg as spl
+    from scipy.linalg.lapack import dgbtrf, dgbtrs, dgbcon, dgecon
+except ImportError:
+    sl = sp = spl = None
+
+# systems with bandwidth wider than this fraction of
+# their size are solved with dense backend by default
+NARROW_BAND = 0.25
+
+
+def chain_dofs(number_of_elements):
+    '''
+    global degrees of freedom of elements chained
+    end to end, one row of four dofs per element
+    '''
+    return 2*np.arange(number_of_elements)[:, np.newaxis] + np.arange(4)
+
+
+def band_width(element_dofs):
+    '''
+    upper bandwidth of global matrix
+    assembled with given element dofs
+    '''
+    element_dofs = np.asarray(element_dofs)
+    if element_dofs.size == 0:
+        return 0
+    return int(
+        (element_dofs.max(axis=1) - element_dofs.min(axis=1)).max()
+        )
+
+
+def assemble_band(element_matrices, element_dofs, n, width=None):
+    '''
+    assembly of (n_elements, 4, 4) stack of element
+    matrices into (width + 1, n) band storage,
+    cost grows linearly with number of elements
+    '''
+    element_matrices = np.asarray(element_matrices, dtype=float)
+    element_dofs = np.asarray(element_dofs)
+    if width is None:
+        width = band_width(element_dofs)
+
+    size = (width + 1) * n
+    band = np.zeros(size)
+
+    for a in range(4):
+        for b in range(4):
+            rows = element_dofs[:, a]
+            cols = element_dofs[:, b]
+            upper = rows <= cols
+            band += np.bincount(
+                (width + rows[upper] - cols[upper]) * n + cols[upper],
+                weights=element_matrices[upper, a, b],
+                minlength=size
+                )
+
+    return band.reshape(width + 1, n)
+
+
+def assemble_dense(element_matrices, element_dofs, n):
+    '''
+    assembly of (n_elements, 4, 4) stack of element
+    matrices into full (n, n) global matrix
+    '''
+    element_dofs = np.asarray(element_dofs)
+    matrix = np.zeros([n, n])
+    np.add.at(
+        matrix,
+        (element_dofs[:, :, np.newaxis], element_dofs[:, np.newaxis, :]),
+        element_matrices
+        )
+    return matrix
+
+
+def assemble_vector(element_vectors, element_dofs, n):
+    '''
+    assembly of (n_elements, 4) stack of
+    element vectors into global vector
+    '''
+    return np.bincount(
+        np.ravel(element_dofs),
+        weights=np.ravel(element_vectors),
+        minlength=n
+        )
+
+
+def add_to_band(band, element_matrices, element_dofs):
+    '''
+    in place addition of (k, 4, 4) element matrices
+    to band storage, cost does not depend on size of band,
+    entries of negative dofs are skipped
+    '''
+    width = band.shape[0] - 1
+    element_dofs = np.asarray(element_dofs)
+    shape = element_matrices.shape
+    rows = np.broadcast_to(element_dofs[:, :, np.newaxis], shape)
+    cols = np.broadcast_to(element_dofs[:, np.newaxis, :], shape)
+    upper = (rows <= cols) & (rows >= 0)
+    np.add.at(
+        band,
+        (width + rows[upper] - cols[upper], cols[upper]),
+        element_matrices[upper]
+        )
+
+
+def band_to_dense(band):
+    '''
+    full symmetric matrix from band storage,
+    stacks of bands give stacks of matrices
+    '''
+    width = band.shape[-2] - 1
+    n = band.shape[-1]
+    matrix = np.zeros(band.shape[:-2] + (n, n))
+
+    for offset in range(width, -1, -1):
+        i = np.arange(n - offset)
+        matrix[..., i, i + offset] = band[..., width - offset, offset:]
+        matrix[..., i + offset, i] = band[..., width - offset, offset:]
+
+    return matrix
+
+
+def band_matvec(band, vector):
+    '''
+    product of symmetric matrix given by band
+    storage and (n,) or (n, k) vector
+    '''
+    vector = np.asarray(vector, dtype=float)
+    width = band.shape[0] - 1
+    n = band.shape[1]
+    diagonal = band[width].reshape((n,) + (1,)*(vector.ndim - 1))
+    product = diagonal * vector
+    for offset in range(1, width + 1):
+        values = band[width - offset, offset:].reshape(
+            (n - offset,) + (1,)*(vector.ndim - 1)
+            )
+        product[:-offset] += values * vector[offset:]
+        product[offset:] += values * vector[:-offset]
+    return product
+
+
+def band_norm(band):
+    '''
+    1-norm (largest column sum) of symmetric
+    matrix given by band storage
+    '''
+    width = band.shape[0] - 1
+    sums = np.abs(band).sum(axis=0)
+    for offset in range(1, width + 1):
+        sums[:-offset] += np.abs(band[width - offset, offset:])
+    return sums.max() if sums.size else 0.0
+
+
+def dense_to_band(matrix, width=None):
+    '''
+    band storage of full symmetric matrix
+    '''
+    matrix = np.asarray(matrix, dtype=float)
+    n = matrix.shape[0]
+    if width is None:
+        rows, cols = np.nonzero(np.triu(matrix))
+        width = int((cols - rows).max()) if rows.size else 0
+
+    band = np.zeros([width + 1, n])
+    for offset in range(width + 1):
+        band[width - offset, offset:] = np.diagonal(matrix, offset)
+
+    return band
+
+
+def reduce_band(band, kept):
+    '''
+    band storage of matrix with only rows and
+    columns of given (sorted) indexes kept
+    '''
+    width = band.shape[0] - 1
+    n = band.shape[1]
+    kept = np.asarray(kept)
+
+    new_index = np.full(n, -1)
+    new_index[kept] = np.arange(kept.size)
+
+    offsets = width - np.arange(width + 1)[:, np.newaxis]
+    cols = np.broadcast_to(np.arange(n), band.shape)
+    rows = cols - offsets
+    valid = (rows >= 0) & (new_index[cols] >= 0)
+    valid[valid] = new_index[rows[valid]] >= 0
+
+    new_rows = new_index[rows[valid]]
+    new_cols = new_index[cols[valid]]
+    new_width = int((new_cols - new_rows).max()) if new_rows.size else 0
+
+    reduced = np.zeros([new_width + 1, kept.size])
+    reduced[new_width + new_rows - new_cols, new_cols] = band[valid]
+
+    return reduced
+
+
+def inverse_norm(solve, n, iterations=5):
+    '''
+    Hager's estimate of 1-norm of inverse of symmetric
+    matrix, needs only few solutions with its factors
+    '''
+    vector = np.full(n, 1 / n)
+    estimate = 0.0
+
+    for _ in range(iterations):
+        solution = solve(vector)
+        estimate = np.abs(solution).sum()
+        gradient = solve(np.sign(solution))
+        column = np.argmax(np.abs(gradient))
+        if np.abs(gradient[column]) <= gradient @ vector:
+            break
+        vector = np.zeros(n)
+        vector[column] = 1.0
+
+    return estimate
+
+
+def _require_scipy(name):
+    if sl is None:
+        raise ImportError('{} solver backend requires scipy'.format(name))
+
+
+class DenseLU:
+    # LU factorization of full matrix (numpy.linalg.solve without scipy)
+    name = 'dense'
+
+    def __init__(self, matrix=None, band=None):
+        if matrix is None:
+            matrix = band_to_dense(band)
+        self.n = matrix.shape[0]
+
+        self.norm = np.abs(matrix).sum(axis=0).max()
+
+        if sl is None:
+            self.matrix = matrix
+            self.factors = None
+        else:
+            self.factors = sl.lu_factor(matrix)
+
+    def solve(self, rhs):
+        if self.factors is None:
+            return lp.solve(self.matrix, rhs)
+        return sl.lu_solve(self.factors, rhs)
+
+    def condition(self):
+        if self.factors is None:
+            return lp.cond(self.matrix, 1)
+        rcond, info = dgecon(self.factors[0], self.norm)
+        return 1 / rcond if rcond else np.inf
+
+
+class BandedCholesky:
+    # Cholesky factorization in band storage,
+    # raises numpy.linalg.LinAlgError when matrix is not positive definite
+    name = 'banded'
+
+    def __init__(self, matrix=None, band=None):
+        _require_scipy(self.name)
+        if band is None:
+            band = dense_to_band(matrix)
+        self.n = band.shape[1]
+        self.norm = band_norm(band)
+        self.factors = sl.cholesky_banded(band, lower=False)
+
+    def solve(self, rhs):
+        return sl.cho_solve_banded((self.factors, False), rhs)
+
+    def condition(self):
+        return self.norm * inverse_norm(self.solve, self.n)
+
+
+class BandedLU:
+    # LU factorization with partial pivoting in LAPACK general band storage
+    name = 'banded_lu'
+
+    def __init__(self, matrix=None, band=None):
+        _require_scipy(self.name)
+        if band is None:
+            band = dense_to_band(matrix)
+        width = band.shape[0] - 1
+        self.n = band.shape[1]
+        self.width = width
+
+        # rows [0, width) are left for fill-in produced by pivoting
+        self.norm = band_norm(band)
+        general = np.zeros([3*width + 1, self.n])
+        general[width:2*width + 1] = band
+        for offset in range(1, width + 1):
+            general[2*width + offset, :self.n - offset] = \
+                band[width - offset, offset:]
+
+        self.factors, self.pivots, info = dgbtrf(general, width, width)
+        if info > 0:
+            raise lp.LinAlgError('Singular matrix')
+
+    def solve(self, rhs):
+        rhs = np.asarray(rhs, dtype=float)
+        solution, info = dgbtrs(
+            self.factors, self.width, self.width,
+            rhs.reshape(self.n, -1), self.pivots
+            )
+        return solution.reshape(rhs.shape)
+
+    def condition(self):
+        rcond, info = dgbcon(
+            self.width, self.width, self.factors, self.pivots, self.norm
+            )
+        return 1 / rcond if rcond else np.inf
+
+
+class SparseLU:
+    # sparse direct solver (SuperLU)
+    name = 'sparse'
+
+    def __init__(self, matrix=None, band=None):
+        _require_scipy(self.name)
+        if band is None:
+            sparse_matrix = sp.csc_matrix(matrix)
+        else:
+            width = band.shape[0] - 1
+            n = band.shape[1]
+            data = np.zeros([2*width + 1, n])
+            data[:width + 1] = band
+            for offset in range(1, width + 1):
+                data[width + offset, :n - offset] = \
+                    band[width - offset, offset:]
+            sparse_matrix = sp.dia_matrix(
+                (data, np.arange(width, -width - 1, -1)), shape=(n, n)
+                ).tocsc()
+        self.n = sparse_matrix.shape[0]
+        self.norm = abs(sparse_matrix).sum(axis=0).max()
+        self.factors = spl.splu(sparse_matrix)
+
+    def solve(self, rhs):
+        return self.factors.solve(np.asarray(rhs, dtype=float))
+
+    def condition(self):
+        return self.norm * inverse_norm(self.solve, self.n)
+
+
+class LowRankUpdate:
+    # Factorization of matrix A0 + E D E^T, where A0 is already
+    # factorized and E picks few (m) rows and columns. Solutions use
+    # Woodbury formula:
+    #   x = y - Z (I + D Z_E)^(-1) D y_E,   y = A0^(-1) b,  Z = A0^(-1) E
+    # so every update costs only m new solutions with factors of A0.
+    name = 'low_rank'
+
+    def __init__(self, base):
+        self.base = base
+        self.n = base.n
+        self.dofs = np.zeros(0, dtype=int)
+        self.delta = np.zeros([0, 0])
+        self.columns = np.zeros([self.n, 0])
+        self.capacitance = np.zeros([0, 0])
+
+    @property
+    def rank(self):
+        return self.dofs.size
+
+    def update(self, dofs, delta):
+        '''
+        adds symmetric (m, m) delta in rows
+        and columns of given unique dofs
+        '''
+        dofs = np.asarray(dofs)
+        new = np.setdiff1d(dofs, self.dofs)
+        if new.size:
+            unit = np.zeros([self.n, new.size])
+            unit[new, np.arange(new.size)] = 1.0
+            self.columns = np.hstack([
+                self.columns, self.base.solve(unit).reshape(self.n, -1)
+                ])
+            self.dofs = np.concatenate([self.dofs, new])
+            self.delta = np.pad(self.delta, (0, new.size))
+
+        position = {dof: index for index, dof in enumerate(self.dofs)}
+        index = np.array([position[dof] for dof in dofs], dtype=int)
+        self.delta[np.ix_(index, index)] += delta
+
+        self.capacitance = np.eye(self.rank) + \
+            self.delta @ self.columns[self.dofs]
+
+    def solve(self, rhs):
+        solution = self.base.solve(rhs)
+        if not self.rank:
+            return solution
+        return solution - self.columns @ lp.solve(
+            self.capacitance, self.delta @ solution[self.dofs]
+            )
+
+    def condition(self):
+        return None
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (DenseLU, BandedCholesky, BandedLU, SparseLU)
+}
+
+
+def choose_backend(n, width):
+    '''
+    name of backend for symmetric system of size n
+    and given bandwidth; banded Cholesky is used for narrow
+    band systems (caller falls back to banded LU
+    when matrix turns out not positive definite)
+    '''
+    if width is None or sl is None or width > NARROW_BAND * n:
+        return 'dense'
+    return 'banded'
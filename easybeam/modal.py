@@ -0,0 +1,109 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem modal tools
+=============================================================================
+modal_analysis      Lowest natural frequencies and mode shapes of beams
+ModalResults        Results of modal_analysis
+=================== ==========================================================
+
+Generalized eigenproblem K x = w^2 M x of boundariezed stiffness and
+mass matrices is solved with shift-invert Lanczos iteration (ARPACK):
+only K - shift*M is factorized, in band storage, and both matrices are
+used through band products, so memory and time grow with
+modes * dofs * bandwidth instead of dofs^3. Small systems are solved
+densely. Requires scipy.
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import numpy.linalg as lp
+
+try:
+    import scipy.linalg as sl
+    import scipy.sparse.linalg as spl
+except ImportError:
+    sl = spl = None
+
+from easyfem.easybeam.linalg import (
+    BandedCholesky, BandedLU, band_matvec, band_to_dense
+)
+
+ModalResults = namedtuple(
+    'ModalResults',
+    [
+        'frequencies',          # (k,) unit: Hz
+        'angular_frequencies',  # (k,) unit: rad/s
+        'modes',                # (n, k) mass normalized mode shapes
+                                # in global dofs (zero in fixed ones)
+    ]
+)
+
+# systems with fewer free dofs are solved with dense eigh
+DENSE_MODAL_LIMIT = 64
+
+
+def modal_analysis(solver, modes=6, lumped=False, shift=0.0, tolerance=0):
+    '''
+    lowest natural frequencies and modes of solver beams
+
+    modes      - number of modes
+    lumped     - lumped (diagonal) mass matrix instead of consistent one
+    shift      - eigenvalues w^2 closest to shift are found, negative
+                 value is needed when beams can move as rigid body
+    tolerance  - relative accuracy of eigenvalues (0: machine precision)
+    '''
+    if sl is None:
+        raise ImportError('modal analysis requires scipy')
+
+    solver.mass_agregation(lumped)
+    stiffness = solver.reduced_band('stiffness')
+    mass = solver.reduced_band('mass')
+    size = stiffness.shape[1]
+    modes = min(modes, size)
+
+    if size <= max(DENSE_MODAL_LIMIT, 2*modes + 1):
+        eigenvalues, vectors = sl.eigh(
+            band_to_dense(stiffness), band_to_dense(mass),
+            subset_by_index=(0, modes - 1)
+            )
+    else:
+        shifted = stiffness - shift*mass
+        try:
+            factorization = BandedCholesky(band=shifted)
+        except lp.LinAlgError:
+            factorization = BandedLU(band=shifted)
+
+        eigenvalues, vectors = spl.eigsh(
+            spl.LinearOperator(
+                (size, size), dtype=float,
+                matvec=lambda vector: band_matvec(stiffness, vector)
+                ),
+            k=modes,
+            M=spl.LinearOperator(
+                (size, size), dtype=float,
+                matvec=lambda vector: band_matvec(mass, vector)
+                ),
+            sigma=shift,
+            which='LM',
+            OPinv=spl.LinearOperator(
+                (size, size), dtype=float, matvec=factorization.solve
+                ),
+            tol=tolerance
+            )
+        # Rayleigh quotients are more accurate than Ritz values
+        # when stiffness and mass differ by many orders of magnitude
+        eigenvalues = (vectors * band_matvec(stiffness, vectors)).sum(axis=0)\
+            / (vectors * band_matvec(mass, vectors)).sum(axis=0)
+        order = np.argsort(eigenvalues)
+        eigenvalues, vectors = eigenvalues[order], vectors[:, order]
+
+    shapes = np.zeros([solver.n, eigenvalues.size])
+    shapes[solver.free_dofs] = vectors
+    angular = np.sqrt(np.maximum(eigenvalues, 0))
+
+    return ModalResults(angular / (2*np.pi), angular, shapes)
@@ -0,0 +1,131 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem model file tools
+=============================================================================
+save_model          Writes beam model to versioned binary model file
+load_model          Reads model file as BeamMesh, arrays are memory-mapped
+                    from file, not copied
+=================== ==========================================================
+
+Model file layout (all numbers little-endian):
+
+    b'EASYBEAM'                  magic, 8 bytes
+    uint16                       format version (MODEL_FORMAT_VERSION)
+    uint32                       length of header
+    header                       JSON: number of elements and blocks,
+                                 every block has dtype, shape and offset
+                                 of data, or value of shared property
+    blocks                       contiguous C-ordered arrays, every one
+                                 aligned to BLOCK_ALIGNMENT bytes
+
+Blocks are the arrays of BeamMesh.arrays; properties equal for all
+elements are stored in header as single values.
+
+"""
+
+import json
+import struct
+
+import numpy as np
+
+from easyfem.easybeam.classes import Beam, BeamMesh
+
+MAGIC = b'EASYBEAM'
+MODEL_FORMAT_VERSION = 1
+BLOCK_ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<8sHI')
+
+
+def _aligned(offset):
+    return -(-offset // BLOCK_ALIGNMENT) * BLOCK_ALIGNMENT
+
+
+def save_model(path, model):
+    '''
+    writes model given as BeamMesh, single Beam
+    or beams in tuple or list to model file
+    '''
+    if isinstance(model, Beam):
+        model = (model,)
+    if not isinstance(model, BeamMesh):
+        model = BeamMesh.from_beams(model)
+
+    blocks = {}
+    arrays = []
+    offset = 0
+    for name, array in model.arrays().items():
+        if np.ndim(array) == 0:
+            blocks[name] = {'value': float(array)}
+            continue
+        array = np.ascontiguousarray(
+            array, dtype=np.dtype(array.dtype).newbyteorder('<')
+            )
+        blocks[name] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset,
+        }
+        arrays.append((offset, array))
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps({'elements': len(model), 'blocks': blocks}).encode()
+    # offsets in header are relative to start of aligned data
+    start = _aligned(_PREAMBLE.size + len(header))
+
+    with open(path, 'wb') as output:
+        output.write(_PREAMBLE.pack(MAGIC, MODEL_FORMAT_VERSION, len(header)))
+        output.write(header)
+        for offset, array in arrays:
+            output.seek(start + offset)
+            array.tofile(output)
+
+
+def _read_header(path):
+
+    with open(path, 'rb') as source:
+        magic, version, length = _PREAMBLE.unpack(
+            source.read(_PREAMBLE.size)
+            )
+        if magic != MAGIC:
+            raise ValueError('{} is not easybeam model file'.format(path))
+        if version > MODEL_FORMAT_VERSION:
+            raise ValueError(
+                'model file version {} is newer than supported {}'.format(
+                    version, MODEL_FORMAT_VERSION
+                    ))
+        header = json.loads(source.read(length).decode())
+
+    return header, _aligned(_PREAMBLE.size + length)
+
+
+def load_model(path, mmap=True):
+    '''
+    BeamMesh of model file, with mmap=False arrays are read
+    into memory instead of being memory-mapped read-only
+    '''
+    header, start = _read_header(path)
+
+    arrays = {}
+    for name, block in header['blocks'].items():
+        if 'value' in block:
+            arrays[name] = block['value']
+            continue
+        dtype = np.dtype(block['dtype'])
+        shape = tuple(block['shape'])
+        if not mmap or 0 in shape:
+            with open(path, 'rb') as source:
+                source.seek(start + block['offset'])
+                arrays[name] = np.fromfile(
+                    source, dtype=dtype, count=int(np.prod(shape))
+                    ).reshape(shape)
+        else:
+            arrays[name] = np.memmap(
+                path, dtype=dtype, mode='r',
+                offset=start + block['offset'], shape=shape
+                )
+
+    return BeamMesh.from_arrays(arrays)
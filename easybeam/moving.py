@@ -0,0 +1,212 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem moving load tools
+=============================================================================
+point_load_vectors  Consistent element loads of point loads placed anywhere
+                    along beam
+influence_lines     Deflections, bending moments and shear forces at nodes
+                    for unit load at many positions, all solved with one
+                    factorization
+InfluenceLines      Results of influence_lines
+moving_load         Responses to group of axles moving along beam, by
+                    superposition of influence lines
+envelope            Maximal and minimal responses to moving axles,
+                    computed in blocks of vehicle positions
+=================== ==========================================================
+
+Unit loads act in direction of positive Beam.loads forces. Positions are
+coordinates measured from start of first element. Right-hand sides of
+all positions are solved in blocks (one call of backend solve per block)
+with factorization kept by solver, so stiffness matrix is factorized
+only once, and memory stays bounded for any number of positions.
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+InfluenceLines = namedtuple(
+    'InfluenceLines',
+    [
+        'positions',    # (n_positions,) coordinates of unit load
+        'nodes',        # (n_nodes,) coordinates of nodes
+        'deflections',  # (n_positions, n_nodes)
+        'moments',      # (n_positions, n_nodes) bending moments
+        'shears',       # (n_positions, n_nodes) shear forces, right
+                        # side of node
+    ]
+)
+
+# number of load positions solved in one block
+BLOCK_SIZE = 128
+
+# positions closer to beam ends than this fraction of
+# beam length are taken as placed at ends
+POSITION_TOLERANCE = 1e-9
+
+
+def _nodes(solver):
+    return np.concatenate([[0.0], np.cumsum(solver.element_lengths)])
+
+
+def point_load_vectors(solver, positions):
+    '''
+    elements (k,) holding point loads at positions (k,) and their
+    (k, 4) consistent system loads (Hermite shape functions),
+    loads at nodes belong to element starting there
+    '''
+    positions = np.asarray(positions, dtype=float)
+    lengths = solver.element_lengths
+    nodes = _nodes(solver)
+    # nodes are sums of lengths, so ends are known up to rounding
+    tolerance = POSITION_TOLERANCE * (nodes[-1] - nodes[0])
+    if np.any(positions < nodes[0] - tolerance) or \
+            np.any(positions > nodes[-1] + tolerance):
+        raise ValueError('load positions outside of beam')
+    positions = np.clip(positions, nodes[0], nodes[-1])
+
+    elements = np.clip(
+        np.searchsorted(nodes, positions, side='right') - 1,
+        0, lengths.size - 1
+        )
+    length = lengths[elements]
+    xi = (positions - nodes[elements]) / length
+
+    vectors = np.stack([
+        1 - 3*xi**2 + 2*xi**3,
+        length*(xi - 2*xi**2 + xi**3),
+        3*xi**2 - 2*xi**3,
+        length*(xi**3 - xi**2),
+        ], axis=1)
+
+    return elements, vectors
+
+
+def influence_lines(solver, positions=None, block_size=BLOCK_SIZE):
+    '''
+    influence lines of all nodes for unit load at positions
+    (every node by default); solver is factorized once
+    '''
+    if not solver.chained:
+        raise ValueError('influence lines need elements chained end to end')
+    nodes = _nodes(solver)
+    positions = nodes if positions is None else \
+        np.asarray(positions, dtype=float)
+    factorization = solver.factorize()
+
+    dofs = solver.element_dofs
+    matrixes = solver.element_stiffness_matrices
+    last = dofs.shape[0] - 1
+    shape = (positions.size, nodes.size)
+    deflections, moments, shears = np.empty(shape), np.empty(shape), \
+        np.empty(shape)
+
+    for start in range(0, positions.size, block_size):
+        block = slice(start, start + block_size)
+        elements, vectors = point_load_vectors(solver, positions[block])
+        cases = np.arange(elements.size)
+
+        loads = np.zeros([solver.n, elements.size])
+        np.add.at(loads, (dofs[elements], cases[:, np.newaxis]), vectors)
+
+        displacements = np.zeros([solver.n, elements.size])
+        displacements[solver.free_dofs] = factorization.solve(
+            loads[solver.free_dofs]
+            )
+
+        # end forces at starts of all elements and end of last one
+        starts = np.einsum(
+            'eij,ejk->eik', matrixes[:, :2], displacements[dofs]
+            )
+        starts[elements, :, cases] -= vectors[:, :2]
+        end = matrixes[last, 2:] @ displacements[dofs[last]]
+        loaded = elements == last
+        end[:, loaded] -= vectors[loaded, 2:].T
+
+        deflections[block] = displacements[0::2].T
+        shears[block, :-1] = starts[:, 0].T
+        shears[block, -1] = -end[0]
+        moments[block, :-1] = starts[:, 1].T
+        moments[block, -1] = -end[1]
+
+    return InfluenceLines(positions, nodes, deflections, moments, shears)
+
+
+def _vehicle_positions(positions, axle_offsets, vehicle_positions):
+    # by default first axle goes from start of influence
+    # line positions, until last axle leaves them
+    if vehicle_positions is not None:
+        return np.asarray(vehicle_positions, dtype=float)
+    return np.union1d(positions, positions + np.max(axle_offsets))
+
+
+def moving_load(
+    positions, line, axle_offsets, axle_loads, vehicle_positions=None
+        ):
+    '''
+    (n_vehicle_positions, n_nodes) responses to axles with given loads
+    and offsets behind first axle, at vehicle positions of first axle
+
+    positions  - ascending positions of influence line
+    line       - (n_positions, n_nodes) influence line, e.g.
+                 InfluenceLines.moments
+
+    axles off positions of influence line give no response
+    '''
+    positions = np.asarray(positions, dtype=float)
+    axle_offsets = np.atleast_1d(np.asarray(axle_offsets, dtype=float))
+    axle_loads = np.broadcast_to(
+        np.asarray(axle_loads, dtype=float), axle_offsets.shape
+        )
+    vehicle_positions = _vehicle_positions(
+        positions, axle_offsets, vehicle_positions
+        )
+
+    # linear interpolation of influence line for every axle
+    # as (n_vehicle_positions, n_positions) weights
+    x = vehicle_positions[:, np.newaxis] - axle_offsets
+    index = np.clip(
+        np.searchsorted(positions, x, side='right') - 1,
+        0, positions.size - 2
+        )
+    fraction = (x - positions[index]) / np.diff(positions)[index]
+    inside = (x >= positions[0]) & (x <= positions[-1])
+    loads = np.where(inside, axle_loads, 0)
+
+    weights = np.zeros([vehicle_positions.size, positions.size])
+    rows = np.broadcast_to(
+        np.arange(vehicle_positions.size)[:, np.newaxis], x.shape
+        )
+    np.add.at(weights, (rows, index), loads*(1 - fraction))
+    np.add.at(weights, (rows, index + 1), loads*fraction)
+
+    return weights @ line
+
+
+def envelope(
+    positions, line, axle_offsets, axle_loads, vehicle_positions=None,
+    block_size=BLOCK_SIZE
+        ):
+    '''
+    (n_nodes,) maximal and minimal responses to moving axles,
+    arguments like in moving_load
+    '''
+    vehicle_positions = _vehicle_positions(
+        np.asarray(positions, dtype=float), axle_offsets, vehicle_positions
+        )
+    maximum = np.full(line.shape[1], -np.inf)
+    minimum = np.full(line.shape[1], np.inf)
+
+    for start in range(0, vehicle_positions.size, block_size):
+        responses = moving_load(
+            positions, line, axle_offsets, axle_loads,
+            vehicle_positions[start:start + block_size]
+            )
+        np.maximum(maximum, responses.max(axis=0), out=maximum)
+        np.minimum(minimum, responses.min(axis=0), out=minimum)
+
+    return maximum, minimum
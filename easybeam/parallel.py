@@ -0,0 +1,99 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem parallel tools
+=============================================================================
+solve_many          Solution of many independent beam models in process
+                    pool, results streamed as they complete
+mesh_arrays         Compact picklable form of beam model
+=================== ==========================================================
+
+Models are sent to workers as few numpy arrays (properties shared by
+all elements as scalars), never as Beam objects, and in chunks of
+several models per task, so pickling and interprocess traffic stay
+small compared to solving.
+
+"""
+
+from concurrent.futures import (
+    ProcessPoolExecutor, FIRST_COMPLETED, wait
+)
+from itertools import islice
+import os
+
+from easyfem.easybeam.classes import (
+    Beam, BeamMesh, BeamSolver, BeamResults
+)
+
+
+def mesh_arrays(model):
+    '''
+    BeamMesh.arrays of model given as BeamMesh,
+    single Beam or beams in tuple or list
+    '''
+    if isinstance(model, Beam):
+        model = (model,)
+    if not isinstance(model, BeamMesh):
+        model = BeamMesh.from_beams(model)
+    return model.arrays()
+
+
+def _solve_chunk(chunk):
+    # runs in worker: [(index, arrays)] -> [(index, results arrays)]
+    solved = []
+    for index, arrays in chunk:
+        results = BeamSolver(BeamMesh.from_arrays(arrays), lazy=True).solve()
+        solved.append((index, {
+            name: getattr(results, name) for name in BeamResults.__slots__
+        }))
+    return solved
+
+
+def _chunks(models, chunksize):
+    models = enumerate(models)
+    while True:
+        chunk = [
+            (index, mesh_arrays(model))
+            for index, model in islice(models, chunksize)
+            ]
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_many(models, workers=None, chunksize=16):
+    '''
+    generator of (index, BeamResults) pairs of models (iterable of
+    BeamMesh, Beam or beams in tuple), in order of completion
+
+    workers    - number of processes, os.cpu_count() by default,
+                 0 or 1 solves models in this process
+    chunksize  - number of models sent to worker in one task
+
+    models are consumed lazily, at most few chunks per worker are
+    waiting in pool; exceptions of models are raised here
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = _chunks(models, chunksize)
+
+    if workers <= 1:
+        for chunk in chunks:
+            for index, arrays in _solve_chunk(chunk):
+                yield index, BeamResults(**arrays)
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = {
+            pool.submit(_solve_chunk, chunk)
+            for chunk in islice(chunks, 2*workers)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for chunk in islice(chunks, 1):
+                    pending.add(pool.submit(_solve_chunk, chunk))
+                for index, arrays in future.result():
+                    yield index, BeamResults(**arrays)
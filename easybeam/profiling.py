@@ -0,0 +1,174 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem profiling tools
+=============================================================================
+PhaseRecord         Measurements of single BeamSolver phase
+SolverReport        Structured report with records of all phases
+phase               Decorator of BeamSolver methods that records measurements
+                    when solver has report or callback
+=================== ==========================================================
+
+Measurements are cheap enough to be left on: wall time, bytes of arrays
+created by phase (numpy arrays and factors kept by solver, not every
+temporary allocation), size of system and condition number estimate
+computed with factors, when phase produced them.
+
+"""
+
+from collections import namedtuple
+from functools import wraps
+from time import perf_counter
+
+import numpy as np
+
+PhaseRecord = namedtuple(
+    'PhaseRecord',
+    [
+        'name',             # name of BeamSolver method
+        'level',            # 0 for phases called directly, 1 for nested
+        'wall_time',        # unit: s
+        'allocated_bytes',  # bytes of arrays created by phase
+        'matrix_shape',     # shape of stored (reduced) stiffness matrix
+        'dofs',             # all degrees of freedom
+        'free_dofs',        # unconstrained degrees of freedom
+        'condition',        # condition number estimate or None
+    ]
+)
+
+
+class SolverReport:
+
+    def __init__(self):
+        self.records = []
+
+    def __repr__(self):
+
+        return '{}({} phases, {:.6f} s)'.format(
+            __class__.__name__,  # noqa: F821
+            len(self.records),
+            self.total_time()
+            )
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def total_time(self):
+        return sum(
+            record.wall_time for record in self.records if record.level == 0
+            )
+
+    def as_dicts(self):
+        return [record._asdict() for record in self.records]
+
+    def table(self):
+        lines = ['{:<24} {:>12} {:>14} {:>12} {:>10} {:>12}'.format(
+            'phase', 'time [s]', 'arrays [B]', 'shape', 'free dofs',
+            'condition'
+            )]
+        for record in self.records:
+            lines.append('{:<24} {:12.6f} {:14d} {:>12} {:>10} {:>12}'.format(
+                '  '*record.level + record.name,
+                record.wall_time,
+                record.allocated_bytes,
+                'x'.join(str(size) for size in record.matrix_shape or ()),
+                record.free_dofs if record.free_dofs is not None else '-',
+                '{:.3e}'.format(record.condition)
+                if record.condition is not None else '-'
+                ))
+        return '\n'.join(lines)
+
+
+def _array_bytes(value, nested=True):
+    # bytes of numpy arrays kept by attribute (objects one level deep)
+    if isinstance(value, np.ndarray):
+        # views of other arrays are skipped, reshaped arrays are not
+        if value.base is None or value.base.nbytes == value.nbytes:
+            return value.nbytes
+        return 0
+    if isinstance(value, (tuple, list)):
+        return sum(_array_bytes(item, nested) for item in value)
+    if nested and hasattr(value, '__dict__'):
+        return sum(
+            _array_bytes(item, False) for item in vars(value).values()
+            )
+    return 0
+
+
+def _system_shape(solver):
+    for name in (
+        'boundariezed_stiffness_band', 'global_stiffness_band',
+        '__boundariezed_stiffness_matrix__', '__global_stiffness_matrix__'
+            ):
+        matrix = getattr(solver, name, None)
+        if matrix is not None:
+            return matrix.shape
+    return None
+
+
+def phase(method):
+    '''
+    decorator of BeamSolver method, with solver.report or
+    solver.callback set measures the call and records it
+    '''
+
+    @wraps(method)
+    def measured(solver, *args, **kwargs):
+        report = getattr(solver, 'report', None)
+        callback = getattr(solver, 'callback', None)
+        if report is None and callback is None:
+            return method(solver, *args, **kwargs)
+
+        level = solver.__phase_level__
+        before = {
+            name: id(value) for name, value in vars(solver).items()
+        }
+        factorization = getattr(solver, 'stiffness_factorization', None)
+
+        solver.__phase_level__ += 1
+        start = perf_counter()
+        try:
+            result = method(solver, *args, **kwargs)
+        finally:
+            wall_time = perf_counter() - start
+            solver.__phase_level__ -= 1
+
+        allocated = sum(
+            _array_bytes(value) for name, value in vars(solver).items()
+            if before.get(name) != id(value)
+            )
+
+        # estimate is computed once for every new factorization
+        condition = None
+        current = getattr(solver, 'stiffness_factorization', None)
+        if current is not None and current is not factorization:
+            condition = getattr(current, 'condition_estimate', None)
+            if condition is None and hasattr(current, 'condition'):
+                condition = current.condition()
+                current.condition_estimate = condition
+
+        free_dofs = getattr(solver, 'free_dofs', None)
+        record = PhaseRecord(
+            method.__name__,
+            level,
+            wall_time,
+            int(allocated),
+            _system_shape(solver),
+            solver.n,
+            None if free_dofs is None else free_dofs.size,
+            condition
+            )
+
+        if report is not None:
+            report.records.append(record)
+        if callback is not None:
+            callback(record)
+
+        return result
+
+    return measured
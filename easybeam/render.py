@@ -0,0 +1,157 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem render tools
+=============================================================================
+decimate            Reduction of long diagram to first, last, minimal and
+                    maximal point of every pixel column
+ResultsFigure       Reusable figure with diagrams of bending moments, shear
+                    forces, displacements and rotations in one panel each
+render_results      Draws results into (new or reused) ResultsFigure and
+                    writes it to file
+render_batch        Writes figures of many models reusing one figure
+=================== ==========================================================
+
+Figures are drawn on Agg canvas without pyplot, so no GUI backend is
+selected, nothing blocks and no global figure state is kept. Diagrams
+drawn by decimate look the same as full ones at figure resolution.
+
+"""
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from easyfem.easybeam.funcs import results_array
+
+# field of results_array, label, unit and color of every panel,
+# same as in easybeam_visualize
+DIAGRAMS = (
+    ('M', 'M', 'Nm', 'red'),
+    ('T', 'T', 'N', 'green'),
+    ('d', 'd', 'm', 'purple'),
+    ('r', 'r', 'rad', 'orange'),
+)
+
+
+def decimate(x, y, columns):
+    '''
+    indices of points of diagram (x ascending) kept, when it is
+    drawn on given number of pixel columns: first, last, minimal
+    and maximal point of every column, in original order
+    '''
+    if x.size <= 4*columns:
+        return np.arange(x.size)
+
+    span = x[-1] - x[0]
+    if span <= 0:
+        bins = np.zeros(x.size, dtype=int)
+    else:
+        bins = np.minimum(
+            ((x - x[0]) * (columns / span)).astype(int), columns - 1
+            )
+
+    # points sorted by column, then by value
+    order = np.lexsort((y, bins))
+    starts = np.flatnonzero(np.diff(bins, prepend=-1))
+    ends = np.append(starts[1:], x.size) - 1
+
+    return np.unique(np.concatenate([
+        starts, ends, order[starts], order[ends]
+        ]))
+
+
+class ResultsFigure:
+    # Multi-panel figure on Agg canvas. Lines are created on first
+    # draw and only their data is replaced later, so one figure may
+    # render thousands of models.
+    #
+    # figsize, dpi  - like in matplotlib.figure.Figure
+    # x_unit        - unit of coordinates
+    # diagrams      - (field, label, unit, color) of every panel
+
+    def __init__(
+        self, figsize=(10, 12), dpi=80, x_unit='m', diagrams=DIAGRAMS
+            ):
+
+        self.figure = Figure(
+            figsize=figsize, dpi=dpi, facecolor='w', edgecolor='k'
+            )
+        FigureCanvasAgg(self.figure)
+        self.diagrams = diagrams
+        self.axes = self.figure.subplots(len(diagrams), 1, sharex=True)
+        self.axes = np.atleast_1d(self.axes)
+        self.columns = int(figsize[0] * dpi)
+        self.lines = []
+        self.fills = []
+
+        for axes, (_, label, unit, _) in zip(self.axes, diagrams):
+            axes.set_ylabel('{} [{}]'.format(label, unit), fontsize=14)
+            axes.grid(True)
+        self.axes[-1].set_xlabel('x [{}]'.format(x_unit), fontsize=14)
+
+    def __repr__(self):
+
+        return '{}({} diagrams)'.format(
+            __class__.__name__,  # noqa: F821
+            len(self.diagrams)
+            )
+
+    def draw(self, *beams, case=0):
+        '''
+        draws results of beams given like for results_array,
+        case chooses load case of results of many load cases
+        '''
+        results = results_array(*beams)
+        x = results['x']
+
+        for index, (axes, diagram) in enumerate(zip(self.axes, self.diagrams)):
+            field, _, _, color = diagram
+            y = results[field]
+            if y.ndim > 1:
+                y = y[:, case]
+            kept = decimate(x, y, self.columns)
+            x_kept, y_kept = x[kept], y[kept]
+
+            if index < len(self.lines):
+                self.lines[index].set_data(x_kept, y_kept)
+                self.fills[index].remove()
+            else:
+                self.lines.append(axes.plot(x_kept, y_kept, color=color)[0])
+                self.fills.append(None)
+            self.fills[index] = axes.fill_between(
+                x_kept, y_kept, color=color, alpha=0.3
+                )
+            axes.relim()
+            axes.autoscale_view()
+
+        return self
+
+    def save(self, path, **kwargs):
+
+        self.figure.savefig(path, **kwargs)
+
+
+def render_results(path, *beams, figure=None, case=0, **kwargs):
+    '''
+    writes diagrams of results (of given load case) to file
+    (format from extension), figure given is reused (kwargs of
+    ResultsFigure are used only for new one), returns figure used
+    '''
+    if figure is None:
+        figure = ResultsFigure(**kwargs)
+    figure.draw(*beams, case=case).save(path)
+    return figure
+
+
+def render_batch(models, paths, **kwargs):
+    '''
+    writes diagrams of every model (BeamSolver, BeamResults,
+    BeamMesh or beams in tuple) to its path with one figure
+    '''
+    figure = ResultsFigure(**kwargs)
+    for model, path in zip(models, paths):
+        figure.draw(model).save(path)
+    return figure
@@ -0,0 +1,196 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem sweep tools
+=============================================================================
+sweep               Solution of one beam layout for many sections and
+                    materials at once
+section_properties  Arrays of section properties used by sweep
+SweepResults        Results of sweep, one value per variant
+=================== ==========================================================
+
+Layout (lengths, loads and boundaries) is shared by all variants, so
+loads are assembled once. When every variant has the same bending
+stiffness in all elements, internal forces do not depend on it and
+displacements only scale, so layout is solved once. Otherwise stiffness
+matrices of all variants are assembled in one pass into stacked band
+storage and solved together: small systems by batched dense LAPACK
+call, larger ones by banded factorization of each variant.
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from easyfem.easybeam.classes import BeamMesh, BeamSolver
+from easyfem.easybeam.linalg import (
+    BandedCholesky, DenseLU, band_width, band_to_dense, reduce_band,
+    choose_backend
+)
+
+SweepResults = namedtuple(
+    'SweepResults',
+    [
+        'max_moment',       # largest absolute bending moment
+        'max_deflection',   # largest absolute displacement
+        'utilization',      # largest bending stress / design strength
+    ]
+)
+
+# largest number of entries of stacked dense
+# matrices solved by one batched LAPACK call
+DENSE_BATCH_LIMIT = 2*10**7
+
+
+def section_properties(sections):
+    '''
+    moments of inertia and elastic moduluses (z axis, the ones
+    used by Beam stifness) of sections given as sequence of Section
+    objects, or as one object with arrays of properties
+    '''
+    if hasattr(sections, 'moment_of_inertia_z'):
+        return (
+            np.asarray(sections.moment_of_inertia_z, dtype=float),
+            np.asarray(sections.elastic_modulus_z, dtype=float)
+            )
+
+    return (
+        np.array([s.moment_of_inertia_z for s in sections], dtype=float),
+        np.array([s.elastic_modulus_z for s in sections], dtype=float)
+        )
+
+
+def _variants(values):
+    # (n_variants, 1) for one value per variant,
+    # (n_variants, n_elements) when elements differ
+    values = np.asarray(values, dtype=float)
+    if values.ndim < 2:
+        return values.reshape(-1, 1)
+    return values
+
+
+def sweep(beams, sections=None, youngs_modulus=None, design_strength=1):
+    '''
+    solution of beam layout for many variants of sections and materials
+
+    beams            - layout: beams in tuple or BeamMesh
+    sections         - sections of variants (see section_properties),
+                       arrays of properties may have shape
+                       (n_variants, n_elements)
+    youngs_modulus   - (n_variants,) or (n_variants, n_elements) values
+    design_strength  - bending stress that gives utilization 1
+
+    sections or youngs_modulus not given are taken from layout
+
+    returns SweepResults with (n_variants,) arrays
+    '''
+    if isinstance(beams, BeamMesh):
+        mesh = beams
+    else:
+        mesh = BeamMesh.from_beams(beams)
+
+    if sections is None:
+        inertia = mesh.moment_of_inertia_z[np.newaxis]
+        modulus = mesh.elastic_modulus_z[np.newaxis]
+    else:
+        inertia, modulus = map(_variants, section_properties(sections))
+    if youngs_modulus is None:
+        youngs = mesh.youngs_modulus[np.newaxis]
+    else:
+        youngs = _variants(youngs_modulus)
+
+    rigidity = youngs * inertia
+    modulus = np.broadcast_to(modulus, rigidity.shape[:1] + modulus.shape[1:])
+
+    # layout with unit bending stiffness
+    unit = BeamSolver(
+        BeamMesh(
+            mesh.lengths,
+            linear_load=mesh.linear_load,
+            end_loads=mesh.end_loads,
+            boundaries=mesh.boundaries,
+            nodes=mesh.nodes
+            ),
+        lazy=True
+        ).assemble()
+
+    if np.ptp(rigidity, axis=1).max() == 0:
+        results = unit.solve()
+        displacements = results.displacements / rigidity[:, :1]
+        internal_forces = results.internal_forces[np.newaxis]
+    else:
+        displacements = _solve_variants(unit, rigidity)
+        internal_forces = rigidity[:, :, np.newaxis] * np.einsum(
+            'eij,vej->vei',
+            unit.element_stiffness_matrices,
+            displacements[:, unit.element_dofs]
+            ) - unit.element_system_loads
+
+    moments = np.maximum(
+        np.abs(internal_forces[..., 1]), np.abs(internal_forces[..., 3])
+        )
+
+    return SweepResults(
+        np.broadcast_to(moments.max(axis=1), rigidity.shape[:1]).copy(),
+        np.abs(displacements[:, 0::2]).max(axis=1),
+        (moments / (modulus * design_strength)).max(axis=1)
+        )
+
+
+def _solve_variants(unit, rigidity):
+    # displacements (n_variants, n) of layout with element
+    # stifness matrices scaled by rigidity (n_variants, n_elements)
+    variants = rigidity.shape[0]
+    n = unit.n
+    dofs = unit.element_dofs
+    matrixes = unit.element_stiffness_matrices
+    width = band_width(dofs)
+    size = (width + 1) * n
+
+    # stacked band storage of all variants assembled in one pass
+    rows = np.broadcast_to(dofs[:, :, np.newaxis], matrixes.shape)
+    cols = np.broadcast_to(dofs[:, np.newaxis, :], matrixes.shape)
+    elements = np.broadcast_to(
+        np.arange(dofs.shape[0])[:, np.newaxis, np.newaxis], matrixes.shape
+        )
+    upper = rows <= cols
+    index = (width + rows[upper] - cols[upper]) * n + cols[upper]
+    weights = rigidity[:, elements[upper]] * matrixes[upper]
+    bands = np.bincount(
+        (np.arange(variants)[:, np.newaxis] * size + index).ravel(),
+        weights=weights.ravel(),
+        minlength=variants * size
+        ).reshape(variants, size)
+
+    # positions of reduced band entries in full band
+    source = reduce_band(
+        np.arange(1, size + 1, dtype=float).reshape(width + 1, n),
+        unit.free_dofs
+        ).astype(int)
+    kept = source > 0
+    reduced = np.zeros((variants,) + source.shape)
+    reduced[:, kept] = bands[:, source[kept] - 1]
+
+    loads = unit.boundariezed_system_loads_vector
+    free = loads.size
+    displacements = np.zeros([variants, n])
+
+    if variants * free**2 <= DENSE_BATCH_LIMIT:
+        displacements[:, unit.free_dofs] = np.linalg.solve(
+            band_to_dense(reduced),
+            np.broadcast_to(loads, (variants, free))[..., np.newaxis]
+            )[..., 0]
+        return displacements
+
+    backend = choose_backend(free, source.shape[0] - 1)
+    for variant in range(variants):
+        if backend == 'banded':
+            factorization = BandedCholesky(band=reduced[variant])
+        else:
+            factorization = DenseLU(band=reduced[variant])
+        displacements[variant, unit.free_dofs] = factorization.solve(loads)
+
+    return displacements
@@ -0,0 +1,139 @@
+"""
+easyfem Analysis Tools
+=========================
+
+=================== ==========================================================
+easyfem topology tools
+=============================================================================
+node_index          Node identifiers of elements and their positions in
+                    sorted list of nodes
+cuthill_mckee_order Reverse Cuthill-McKee ordering of nodes, which makes
+                    band of global matrix narrow
+number_dofs         Global degrees of freedom of elements connected by
+                    nodes given in any order
+chain_numbering     Numbering of elements chained end to end
+DofNumbering        Results of number_dofs
+=================== ==========================================================
+
+Every node has two dofs (deflection, rotation) numbered together, so
+node k of ordering gets dofs 2k and 2k+1 and even dofs stay deflections.
+Upper bandwidth of global matrix is 2*(node bandwidth)+1, so ordering of
+nodes is enough to keep banded and sparse solvers efficient for elements
+given in any order. scipy.sparse.csgraph is used when installed, pure
+numpy breadth-first search otherwise.
+
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from easyfem.easybeam.linalg import chain_dofs
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+except ImportError:
+    sp = reverse_cuthill_mckee = None
+
+DofNumbering = namedtuple(
+    'DofNumbering',
+    [
+        'node_ids',      # (n_nodes,) sorted identifiers of nodes
+        'node_dofs',     # (n_nodes, 2) global dofs of nodes
+        'element_dofs',  # (n_elements, 4) global dofs of elements
+        'n',             # number of global dofs
+    ]
+)
+
+
+def node_index(element_nodes):
+    '''
+    sorted node identifiers (n_nodes,) and (n_elements, 2)
+    positions of start and end node of every element among them
+    '''
+    element_nodes = np.asarray(element_nodes).reshape(-1, 2)
+    node_ids, index = np.unique(element_nodes, return_inverse=True)
+    return node_ids, index.reshape(-1, 2)
+
+
+def _breadth_first_order(rows, cols, n_nodes):
+    # Cuthill-McKee without scipy: every connected part is searched
+    # from its node of lowest degree, neighbours by ascending degree
+    degree = np.bincount(rows, minlength=n_nodes)
+    order = np.lexsort((degree[cols], rows))
+    neighbours = cols[order].tolist()
+    starts = np.concatenate([[0], np.cumsum(degree)]).tolist()
+
+    visited = np.zeros(n_nodes, dtype=bool)
+    ordering = []
+    for start in np.argsort(degree, kind='stable').tolist():
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for neighbour in neighbours[starts[node]:starts[node + 1]]:
+                if not visited[neighbour]:
+                    visited[neighbour] = True
+                    queue.append(neighbour)
+        ordering.extend(queue)
+
+    return np.array(ordering[::-1], dtype=int)
+
+
+def cuthill_mckee_order(element_index, n_nodes=None):
+    '''
+    (n_nodes,) positions of nodes (like from node_index) in reverse
+    Cuthill-McKee order, neighbours get close numbers
+    '''
+    element_index = np.asarray(element_index).reshape(-1, 2)
+    if n_nodes is None:
+        n_nodes = int(element_index.max()) + 1 if element_index.size else 0
+
+    rows = np.concatenate([element_index[:, 0], element_index[:, 1]])
+    cols = np.concatenate([element_index[:, 1], element_index[:, 0]])
+
+    if reverse_cuthill_mckee is None:
+        return _breadth_first_order(rows, cols, n_nodes)
+
+    graph = sp.csr_matrix(
+        (np.ones(rows.size), (rows, cols)), shape=(n_nodes, n_nodes)
+        )
+    return np.asarray(
+        reverse_cuthill_mckee(graph, symmetric_mode=True), dtype=int
+        )
+
+
+def number_dofs(element_nodes, reorder=True):
+    '''
+    DofNumbering of elements given by (n_elements, 2) identifiers
+    of their start and end nodes; with reorder=False nodes are
+    numbered by ascending identifiers
+    '''
+    node_ids, index = node_index(element_nodes)
+
+    position = np.arange(node_ids.size)
+    if reorder:
+        position[cuthill_mckee_order(index, node_ids.size)] = \
+            np.arange(node_ids.size)
+
+    node_dofs = 2*position[:, np.newaxis] + np.arange(2)
+    element_dofs = node_dofs[index].reshape(-1, 4)
+
+    return DofNumbering(node_ids, node_dofs, element_dofs, 2*node_ids.size)
+
+
+def chain_numbering(number_of_elements):
+    '''
+    DofNumbering of elements chained end to end,
+    nodes are numbered along the chain
+    '''
+    n_nodes = number_of_elements + 1
+    return DofNumbering(
+        np.arange(n_nodes), np.arange(2*n_nodes).reshape(-1, 2),
+        chain_dofs(number_of_elements), 2*n_nodes
+        )
@@ -5,9 +5,23 @@ from easyfem.easysections.easysections import (
     IBeamSection
 )
 
+from easyfem.easysections.arrays import (
+    SectionArray,
+    RectangleSectionArray, CircleSectionArray,
+    HollowCircleArray, HollowRectangleArray,
+    IBeamSectionArray
+)
+
+from easyfem.easysections.catalogue import Catalogue, catalogue
+
 __all__ = [
     'Section',
     'RectangleSection', 'CircleSection',
     'HollowCircle', 'HollowRectangle',
-    'IBeamSection'
+    'IBeamSection',
+    'SectionArray',
+    'RectangleSectionArray', 'CircleSectionArray',
+    'HollowCircleArray', 'HollowRectangleArray',
+    'IBeamSectionArray',
+    'Catalogue', 'catalogue'
 ]
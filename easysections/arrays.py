@@ -0,0 +1,205 @@
+# Array Sections Classes
+# for easyfem Numerical Calculations
+#
+# Same sections as in easysections.py, but every dimension may be
+# a numpy array: properties of all profiles are computed at once,
+# without sub-section objects. Indexing gives scalar section of
+# single profile (or array section for slices), so array sections
+# may be used as section of BeamMesh and items as section of Beam.
+# Beam takes array section of one profile as well, arrays of more
+# profiles raise TypeError.
+
+import numpy as np
+
+from easyfem.easysections.easysections import (
+    RectangleSection, CircleSection,
+    HollowCircle, HollowRectangle,
+    IBeamSection
+)
+
+
+class SectionArray():
+
+    # names of dimensions, in order of constructor arguments
+    dimensions = ()
+    # class of single section with same constructor arguments
+    scalar = None
+    # attributes of scalar section holding dimensions, when named
+    # differently than dimensions
+    scalar_dimensions = None
+
+    def __init__(self, *dimensions):
+
+        # scalar dimensions give array of one profile
+        arrays = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=float))
+              for value in dimensions)
+            )
+        for name, value in zip(self.dimensions, arrays):
+            setattr(self, name, value)
+
+        self.moments_of_inertias()
+        self.elastic_moduluses()
+
+    def __repr__(self):
+
+        return '{}({} sections)'.format(
+            self.__class__.__name__,
+            len(self)
+            )
+
+    def __len__(self):
+
+        return getattr(self, self.dimensions[0]).size
+
+    def __getitem__(self, index):
+
+        values = [getattr(self, name)[index] for name in self.dimensions]
+        if np.ndim(values[0]):
+            return self.__class__(*values)
+        return self.scalar(*(float(value) for value in values))
+
+    def __iter__(self):
+
+        for index in range(len(self)):
+            yield self[index]
+
+    @classmethod
+    def from_sections(cls, sections):
+
+        return cls(*(
+            [getattr(section, name) for section in sections]
+            for name in cls.scalar_dimensions or cls.dimensions
+            ))
+
+    def return_strong_i_moment(self):
+
+        return self.moment_of_inertia_y
+
+    def return_weak_i_moment(self):
+
+        return self.moment_of_inertia_z
+
+    def return_area(self):
+
+        return self.area
+
+
+class RectangleSectionArray(SectionArray):
+
+    dimensions = ('height', 'width')
+    scalar = RectangleSection
+
+    def __init__(self, height, width):
+
+        if np.any(np.asarray(width) == 0) or np.any(np.asarray(height) == 0):
+            raise ValueError('height and width must be non-zero')
+
+        super().__init__(height, width)
+
+    def moments_of_inertias(self):
+
+        self.area = self.height*self.width
+        self.moment_of_inertia_y = (self.height**3 * self.width) / 12
+        self.moment_of_inertia_z = (self.height * self.width**3) / 12
+
+    def elastic_moduluses(self):
+
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.height/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.width/2)
+
+
+class CircleSectionArray(SectionArray):
+
+    dimensions = ('diameter',)
+    scalar = CircleSection
+
+    def __init__(self, diameter):
+
+        if np.any(np.asarray(diameter) == 0):
+            raise ValueError('diameter must be non-zero')
+
+        super().__init__(diameter)
+
+    def moments_of_inertias(self):
+
+        self.area = np.pi * (self.diameter/2)**2
+        self.moment_of_inertia_y = np.pi * (self.diameter**4 / 64)
+        self.moment_of_inertia_z = self.moment_of_inertia_y
+
+    def elastic_moduluses(self):
+
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.diameter/2)
+        self.elastic_modulus_z = self.elastic_modulus_y
+
+
+class HollowCircleArray(SectionArray):
+
+    dimensions = ('big_diamater', 'small_diamater')
+    scalar = HollowCircle
+
+    def moments_of_inertias(self):
+
+        self.area = np.pi * (self.big_diamater**2 - self.small_diamater**2) / 4
+        self.moment_of_inertia_y = np.pi * (
+            self.big_diamater**4 - self.small_diamater**4
+            ) / 64
+        self.moment_of_inertia_z = self.moment_of_inertia_y
+
+    def elastic_moduluses(self):
+
+        self.elastic_modulus_y = \
+            self.moment_of_inertia_y / (self.big_diamater/2)
+        self.elastic_modulus_z = self.elastic_modulus_y
+
+
+class HollowRectangleArray(SectionArray):
+
+    dimensions = ('height', 'width', 'thickness')
+    scalar = HollowRectangle
+    scalar_dimensions = ('outside_height', 'outside_width', 'thickness')
+
+    def moments_of_inertias(self):
+
+        # same inside dimensions as HollowRectangle
+        inside_height = self.height - 2*self.thickness
+        inside_width = self.width - 2*self.thickness
+
+        self.area = self.height*self.width - inside_height*inside_width
+        self.moment_of_inertia_y = (
+            self.height**3 * self.width - inside_height**3 * inside_width
+            ) / 12
+        self.moment_of_inertia_z = (
+            self.height * self.width**3 - inside_height * inside_width**3
+            ) / 12
+
+    def elastic_moduluses(self):
+
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.height/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.width/2)
+
+
+class IBeamSectionArray(SectionArray):
+
+    dimensions = ('height', 'width', 'flange_thickness', 'web_thickness')
+    scalar = IBeamSection
+
+    def moments_of_inertias(self):
+
+        web_height = self.height - 2 * self.flange_thickness
+
+        self.area = 2 * self.flange_thickness * self.width + \
+            web_height * self.web_thickness
+        self.moment_of_inertia_y = (1/12) * (
+            self.width * self.height**3 -
+            (self.width - self.web_thickness) * web_height**3
+            )
+        self.moment_of_inertia_z = (1/12) * (
+            2 * self.flange_thickness * self.width**3 +
+            web_height * self.web_thickness**3
+            )
+
+    def elastic_moduluses(self):
+
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.height/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.width/2)
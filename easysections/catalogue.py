@@ -0,0 +1,245 @@
+# Standard Steel Profiles Catalogue
+# for easyfem Numerical Calculations
+#
+# IPE, HEA, HEB, RHS and CHS profiles are kept in bundled profiles.npy
+# structured array (one row per profile, units: m, kg/m). File is
+# memory-mapped on first lookup, so importing easysections reads
+# nothing, and queries read only columns they need.
+#
+# Rebuild file from profile_tables.py with write_catalogue().
+
+import os
+
+import numpy as np
+
+from easyfem.easysections.easysections import (
+    HollowCircle, HollowRectangle, IBeamSection
+)
+from easyfem.easysections.arrays import (
+    HollowCircleArray, HollowRectangleArray, IBeamSectionArray
+)
+
+CATALOGUE_PATH = os.path.join(os.path.dirname(__file__), 'profiles.npy')
+
+STEEL_DENSITY = 7850  # unit: kg/m^3
+
+CATALOGUE_DTYPE = np.dtype([
+    ('designation', 'U16'),
+    ('family', 'U3'),
+    ('height', float),              # unit: m
+    ('width', float),               # unit: m
+    ('flange_thickness', float),    # unit: m, I profiles
+    ('web_thickness', float),       # unit: m, I profiles
+    ('thickness', float),           # unit: m, hollow sections
+    ('diameter', float),            # unit: m, CHS
+    ('area', float),                # unit: m^2
+    ('mass', float),                # unit: kg/m
+    ('moment_of_inertia_y', float),  # unit: m^4
+    ('moment_of_inertia_z', float),  # unit: m^4
+    ('elastic_modulus_y', float),   # unit: m^3
+    ('elastic_modulus_z', float),   # unit: m^3
+])
+
+I_FAMILIES = ('IPE', 'HEA', 'HEB')
+
+
+def _key(designation):
+    # designations are matched without spaces and case
+    return designation.replace(' ', '').upper()
+
+
+class Catalogue():
+
+    def __init__(self, path=CATALOGUE_PATH):
+
+        self.path = path
+        self.__table__ = None
+        self.__index__ = None
+
+    def __repr__(self):
+
+        return '{}({!r})'.format(
+            __class__.__name__,  # noqa: F821
+            self.path
+            )
+
+    def __len__(self):
+
+        return self.table.size
+
+    def __contains__(self, designation):
+
+        return _key(designation) in self.index
+
+    def __getitem__(self, designation):
+
+        return self.section(self.row(designation))
+
+    @property
+    def table(self):
+        # read-only memory-mapped structured array
+        if self.__table__ is None:
+            self.__table__ = np.load(self.path, mmap_mode='r')
+        return self.__table__
+
+    @property
+    def index(self):
+        # row numbers of designations, built on first lookup
+        if self.__index__ is None:
+            self.__index__ = {
+                _key(designation): row for row, designation
+                in enumerate(self.table['designation'])
+            }
+        return self.__index__
+
+    def row(self, designation):
+
+        try:
+            return self.index[_key(designation)]
+        except KeyError:
+            raise KeyError(
+                'no profile {!r} in catalogue'.format(designation)
+                ) from None
+
+    def designations(self, family=None):
+
+        return [
+            str(self.table['designation'][row])
+            for row in self.rows(family)
+            ]
+
+    def rows(self, family=None, **ranges):
+        '''
+        numbers of rows of given family (name or tuple of names)
+        with properties in ranges given as property=(min, max),
+        None leaves range open
+        '''
+        mask = np.ones(len(self), dtype=bool)
+        if family is not None:
+            families = (family,) if isinstance(family, str) else family
+            mask &= np.isin(
+                self.table['family'], [name.upper() for name in families]
+                )
+        for name, (lower, upper) in ranges.items():
+            values = self.table[name]
+            if lower is not None:
+                mask &= values >= lower
+            if upper is not None:
+                mask &= values <= upper
+        return np.flatnonzero(mask)
+
+    def select(self, family=None, **ranges):
+        '''
+        designations of profiles matching rows criteria,
+        from the lightest one
+        '''
+        rows = self.rows(family, **ranges)
+        rows = rows[np.argsort(self.table['mass'][rows], kind='stable')]
+        return [str(self.table['designation'][row]) for row in rows]
+
+    def lightest(self, family=None, **minimums):
+        '''
+        section of lightest profile with properties not
+        smaller than given, for example lightest(moment_of_inertia_y=x)
+        '''
+        rows = self.rows(
+            family,
+            **{name: (value, None) for name, value in minimums.items()}
+            )
+        if rows.size == 0:
+            raise ValueError('no profile in catalogue meets criteria')
+        return self.section(rows[np.argmin(self.table['mass'][rows])])
+
+    def section(self, row):
+        '''
+        IBeamSection, HollowRectangle or HollowCircle of given row
+        '''
+        profile = self.table[row]
+        family = str(profile['family'])
+
+        if family in I_FAMILIES:
+            section = IBeamSection(
+                float(profile['height']), float(profile['width']),
+                float(profile['flange_thickness']),
+                float(profile['web_thickness'])
+                )
+        elif family == 'RHS':
+            section = HollowRectangle(
+                float(profile['height']), float(profile['width']),
+                float(profile['thickness'])
+                )
+        else:
+            section = HollowCircle(
+                float(profile['diameter']),
+                float(profile['diameter'] - 2*profile['thickness'])
+                )
+
+        section.designation = str(profile['designation'])
+        section.mass = float(profile['mass'])
+        return section
+
+
+def catalogue_table():
+    '''
+    structured array of all profiles from profile_tables
+    '''
+    from easyfem.easysections import profile_tables
+
+    rows = []
+    for family in I_FAMILIES:
+        for designation, dimensions in getattr(profile_tables, family).items():
+            height, width, web, flange = (value / 1000 for value in dimensions)
+            rows.append((designation, family, height, width, flange, web))
+    for (height, width), thicknesses in profile_tables.RHS.items():
+        for thickness in thicknesses:
+            rows.append((
+                'RHS{}x{}x{:g}'.format(height, width, thickness), 'RHS',
+                height / 1000, width / 1000, 0, 0, thickness / 1000
+                ))
+    for diameter, thicknesses in profile_tables.CHS.items():
+        for thickness in thicknesses:
+            rows.append((
+                'CHS{:g}x{:g}'.format(diameter, thickness), 'CHS',
+                diameter / 1000, diameter / 1000, 0, 0, thickness / 1000,
+                diameter / 1000
+                ))
+
+    # properties are left zero and computed below
+    columns = len(CATALOGUE_DTYPE.names)
+    table = np.array(
+        [values + (0,)*(columns - len(values)) for values in rows],
+        dtype=CATALOGUE_DTYPE
+        )
+
+    family = table['family']
+    groups = (
+        (np.isin(family, I_FAMILIES), lambda rows: IBeamSectionArray(
+            rows['height'], rows['width'],
+            rows['flange_thickness'], rows['web_thickness']
+            )),
+        (family == 'RHS', lambda rows: HollowRectangleArray(
+            rows['height'], rows['width'], rows['thickness']
+            )),
+        (family == 'CHS', lambda rows: HollowCircleArray(
+            rows['diameter'], rows['diameter'] - 2*rows['thickness']
+            )),
+    )
+    for mask, sections in groups:
+        properties = sections(table[mask])
+        for name in (
+            'area', 'moment_of_inertia_y', 'moment_of_inertia_z',
+            'elastic_modulus_y', 'elastic_modulus_z'
+                ):
+            table[name][mask] = getattr(properties, name)
+    table['mass'] = table['area'] * STEEL_DENSITY
+
+    return table
+
+
+def write_catalogue(path=CATALOGUE_PATH):
+
+    np.save(path, catalogue_table())
+
+
+# catalogue of bundled profiles, loaded on first lookup
+catalogue = Catalogue()
@@ -55,8 +55,8 @@ class RectangleSection(Section):
 
     def elastic_moduluses(self):
 
-        self.elastic_modulus_y = self.moment_of_inertia_y * (self.height/2)
-        self.elastic_modulus_z = self.moment_of_inertia_z * (self.width/2)
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.height/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.width/2)
 
     def rotate(self):
 
@@ -92,8 +92,8 @@ class CircleSection(Section):
 
     def elastic_moduluses(self):
 
-        self.elastic_modulus_y = self.moment_of_inertia_y * (self.diameter/2)
-        self.elastic_modulus_z = self.moment_of_inertia_z * (self.diameter/2)
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.diameter/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.diameter/2)
 
 
 class HollowCircle(Section):
@@ -126,10 +126,10 @@ class HollowCircle(Section):
 
     def elastic_moduluses(self):
 
-        self.elastic_modulus_y = self.outside_circle.elastic_modulus_y - \
-            self.inside_circle.elastic_modulus_y
-        self.elastic_modulus_z = self.outside_circle.elastic_modulus_z - \
-            self.inside_circle.elastic_modulus_z
+        self.elastic_modulus_y = \
+            self.moment_of_inertia_y / (self.big_diamater/2)
+        self.elastic_modulus_z = \
+            self.moment_of_inertia_z / (self.big_diamater/2)
 
 
 class HollowRectangle(Section):
@@ -139,8 +139,8 @@ class HollowRectangle(Section):
         self.outside_height = height
         self.outside_width = width
         self.thickness = thickness
-        self.inside_height = height - 0.5*self.thickness
-        self.inside_width = width - 0.5*self.thickness
+        self.inside_height = height - 2*self.thickness
+        self.inside_width = width - 2*self.thickness
 
         self.outside_rectangle = RectangleSection(
             self.outside_height,
@@ -176,11 +176,9 @@ class HollowRectangle(Section):
     def elastic_moduluses(self):
 
         self.elastic_modulus_y = \
-            self.outside_rectangle.elastic_modulus_y - \
-            self.outside_rectangle.elastic_modulus_y
+            self.moment_of_inertia_y / (self.outside_height/2)
         self.elastic_modulus_z = \
-            self.outside_rectangle.elastic_modulus_z - \
-            self.outside_rectangle.elastic_modulus_z
+            self.moment_of_inertia_z / (self.outside_width/2)
 
 
 class IBeamSection(Section):
@@ -220,5 +218,5 @@ class IBeamSection(Section):
 
     def elastic_moduluses(self):
 
-        self.elastic_modulus_y = self.moment_of_inertia_y * (self.height/2)
-        self.elastic_modulus_z = self.moment_of_inertia_z * (self.width/2)
+        self.elastic_modulus_y = self.moment_of_inertia_y / (self.height/2)
+        self.elastic_modulus_z = self.moment_of_inertia_z / (self.width/2)
@@ -0,0 +1,110 @@
+# Dimension Tables of Standard Steel Profiles
+# for easyfem Numerical Calculations
+#
+# Source of bundled profiles.npy catalogue, used only when catalogue
+# is rebuilt (see catalogue.write_catalogue). Units: mm.
+# Root radii and corner radii are not included, properties in
+# catalogue are computed with easysections formulas of sharp-cornered
+# sections, so they differ from published ones by few percent.
+
+# I profiles: designation: (height, width, web_thickness, flange_thickness)
+IPE = {
+    'IPE80': (80, 46, 3.8, 5.2),
+    'IPE100': (100, 55, 4.1, 5.7),
+    'IPE120': (120, 64, 4.4, 6.3),
+    'IPE140': (140, 73, 4.7, 6.9),
+    'IPE160': (160, 82, 5.0, 7.4),
+    'IPE180': (180, 91, 5.3, 8.0),
+    'IPE200': (200, 100, 5.6, 8.5),
+    'IPE220': (220, 110, 5.9, 9.2),
+    'IPE240': (240, 120, 6.2, 9.8),
+    'IPE270': (270, 135, 6.6, 10.2),
+    'IPE300': (300, 150, 7.1, 10.7),
+    'IPE330': (330, 160, 7.5, 11.5),
+    'IPE360': (360, 170, 8.0, 12.7),
+    'IPE400': (400, 180, 8.6, 13.5),
+    'IPE450': (450, 190, 9.4, 14.6),
+    'IPE500': (500, 200, 10.2, 16.0),
+    'IPE550': (550, 210, 11.1, 17.2),
+    'IPE600': (600, 220, 12.0, 19.0),
+}
+
+HEA = {
+    'HEA100': (96, 100, 5.0, 8.0),
+    'HEA120': (114, 120, 5.0, 8.0),
+    'HEA140': (133, 140, 5.5, 8.5),
+    'HEA160': (152, 160, 6.0, 9.0),
+    'HEA180': (171, 180, 6.0, 9.5),
+    'HEA200': (190, 200, 6.5, 10.0),
+    'HEA220': (210, 220, 7.0, 11.0),
+    'HEA240': (230, 240, 7.5, 12.0),
+    'HEA260': (250, 260, 7.5, 12.5),
+    'HEA280': (270, 280, 8.0, 13.0),
+    'HEA300': (290, 300, 8.5, 14.0),
+    'HEA320': (310, 300, 9.0, 15.5),
+    'HEA340': (330, 300, 9.5, 16.5),
+    'HEA360': (350, 300, 10.0, 17.5),
+    'HEA400': (390, 300, 11.0, 19.0),
+    'HEA450': (440, 300, 11.5, 21.0),
+    'HEA500': (490, 300, 12.0, 23.0),
+    'HEA550': (540, 300, 12.5, 24.0),
+    'HEA600': (590, 300, 13.0, 25.0),
+}
+
+HEB = {
+    'HEB100': (100, 100, 6.0, 10.0),
+    'HEB120': (120, 120, 6.5, 11.0),
+    'HEB140': (140, 140, 7.0, 12.0),
+    'HEB160': (160, 160, 8.0, 13.0),
+    'HEB180': (180, 180, 8.5, 14.0),
+    'HEB200': (200, 200, 9.0, 15.0),
+    'HEB220': (220, 220, 9.5, 16.0),
+    'HEB240': (240, 240, 10.0, 17.0),
+    'HEB260': (260, 260, 10.0, 17.5),
+    'HEB280': (280, 280, 10.5, 18.0),
+    'HEB300': (300, 300, 11.0, 19.0),
+    'HEB320': (320, 300, 11.5, 20.5),
+    'HEB340': (340, 300, 12.0, 21.5),
+    'HEB360': (360, 300, 12.5, 22.5),
+    'HEB400': (400, 300, 13.5, 24.0),
+    'HEB450': (450, 300, 14.0, 26.0),
+    'HEB500': (500, 300, 14.5, 28.0),
+    'HEB550': (550, 300, 15.0, 29.0),
+    'HEB600': (600, 300, 15.5, 30.0),
+}
+
+# rectangular hollow sections: (height, width): thicknesses
+RHS = {
+    (50, 30): (2.5, 3.0, 4.0),
+    (60, 40): (3.0, 4.0, 5.0),
+    (80, 40): (3.0, 4.0, 5.0),
+    (100, 50): (3.0, 4.0, 5.0, 6.3),
+    (100, 60): (4.0, 5.0, 6.3),
+    (120, 60): (4.0, 5.0, 6.3),
+    (120, 80): (4.0, 5.0, 6.3, 8.0),
+    (140, 80): (4.0, 5.0, 6.3, 8.0),
+    (150, 100): (5.0, 6.3, 8.0, 10.0),
+    (160, 80): (5.0, 6.3, 8.0),
+    (180, 100): (5.0, 6.3, 8.0, 10.0),
+    (200, 100): (5.0, 6.3, 8.0, 10.0),
+    (250, 150): (6.3, 8.0, 10.0, 12.5),
+    (300, 200): (8.0, 10.0, 12.5),
+}
+
+# circular hollow sections: diameter: thicknesses
+CHS = {
+    21.3: (2.0, 2.6),
+    26.9: (2.0, 2.6, 3.2),
+    33.7: (2.6, 3.2, 4.0),
+    42.4: (2.6, 3.2, 4.0),
+    48.3: (2.6, 3.2, 4.0, 5.0),
+    60.3: (3.2, 4.0, 5.0),
+    76.1: (3.2, 4.0, 5.0, 6.3),
+    88.9: (3.2, 4.0, 5.0, 6.3),
+    114.3: (3.6, 4.0, 5.0, 6.3, 8.0),
+    139.7: (4.0, 5.0, 6.3, 8.0, 10.0),
+    168.3: (4.0, 5.0, 6.3, 8.0, 10.0),
+    219.1: (5.0, 6.3, 8.0, 10.0, 12.5),
+    273.0: (6.3, 8.0, 10.0, 12.5),
+    323.9: (6.3, 8.0, 10.0, 12.5),
+}
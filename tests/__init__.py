@@ -0,0 +1,7 @@
+"""
+Regression tests of easyfem.
+
+Results of optimized paths are compared with fresh solutions or with
+analytic values. Run from directory containing easyfem with:
+    python -m pytest easyfem/tests
+"""
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamMesh
+
+
+@pytest.fixture
+def simply_supported():
+    '''
+    factory of simply supported BeamMesh of equal elements,
+    pinned at start and on roller at end
+    '''
+    def mesh(
+        elements=20, length=10.0, youngs_modulus=2e8, density=1,
+        linear_load=0
+            ):
+        mesh = BeamMesh(
+            np.full(elements, length / elements), youngs_modulus,
+            linear_load=linear_load, density=density
+            )
+        mesh.boundaries[0, 0] = True
+        mesh.boundaries[-1, 2] = True
+        return mesh
+
+    return mesh
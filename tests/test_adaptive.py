@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamMesh, BeamSolver, adaptive_discretization
+
+
+def test_adaptive_keeps_nodes_of_mesh():
+    # simply supported beam of 4 elements given in shuffled order
+    mesh = BeamMesh(
+        np.full(4, 2.5), 2e8, linear_load=-1e3,
+        nodes=[[12, 13], [10, 11], [13, 14], [11, 12]]
+        )
+    mesh.support(10)
+    mesh.support(14)
+
+    refined = adaptive_discretization(mesh, tolerance=1e-3)
+
+    deflection = 5 * 1e3 * 10**4 / (384 * 2e8)
+    assert refined.nodes is not None
+    assert np.isclose(np.abs(refined.displacements[:, 0]).max(), deflection)
+    BeamSolver(mesh)
+    assert np.isclose(np.abs(mesh.displacements[:, 0]).max(), deflection)
+
+
+def loaded_beam():
+    # propped cantilever with point load, uniform
+    # load and stiffness varying along beam
+    mesh = BeamMesh(
+        np.full(8, 1.25), np.linspace(1e8, 3e8, 8), linear_load=-1e3
+        )
+    mesh.boundaries[0, :2] = True
+    mesh.boundaries[-1, 2] = True
+    mesh.end_loads[3, 2] = -5e3
+    return mesh
+
+
+def test_refine_matches_new_solution():
+    from easyfem.easybeam.funcs import refine
+
+    mesh = loaded_beam()
+    BeamSolver(mesh)
+    marked = np.arange(8) % 3 == 0
+    refined = refine(mesh, marked)
+
+    solved = refined.subdivide(1)
+    BeamSolver(solved)
+    assert np.allclose(refined.displacements, solved.displacements)
+    assert np.allclose(refined.internal_forces, solved.internal_forces)
+
+
+def test_refinement_depends_on_solution():
+    mesh = BeamMesh(np.full(4, 2.5), 2e8, linear_load=-1e3)
+    mesh.boundaries[0, 0] = mesh.boundaries[-1, 2] = True
+
+    refined = adaptive_discretization(mesh, tolerance=1e-3)
+
+    # small moments near supports need finer division than midspan
+    assert refined.lengths[0] < refined.lengths[len(refined) // 2]
+
+
+def test_warning_when_not_converged():
+    from easyfem.easybeam.funcs import Not_Converged
+
+    with pytest.warns(Not_Converged):
+        refined = adaptive_discretization(
+            loaded_beam(), tolerance=1e-6, max_elements=100
+            )
+    assert len(refined) <= 100
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamSolver, time_history
+
+pytest.importorskip('scipy')
+
+
+@pytest.fixture
+def steel_beam(simply_supported):
+    return simply_supported(
+        youngs_modulus=2e11, density=7850, linear_load=-1e3
+        )
+
+
+@pytest.mark.parametrize('assembly', ['banded', 'dense'])
+@pytest.mark.parametrize('lumped', [False, True])
+def test_damped_response_reaches_static(assembly, lumped, steel_beam):
+    solver = BeamSolver(steel_beam, assembly=assembly, lazy=True)
+    static = solver.solve().displacements
+    loads = np.broadcast_to(
+        solver.global_system_loads_vector, (3001, solver.n)
+        )
+    scale = np.abs(static).max()
+
+    for step in time_history(
+        solver, loads, 1e-3, alpha=-0.1, mass_damping=20, lumped=lumped
+            ):
+        pass
+
+    assert np.allclose(step.displacements, static, rtol=0, atol=1e-8*scale)
+    assert np.allclose(step.velocities, 0, atol=1e-8*scale)
+
+
+@pytest.mark.parametrize('lumped', [False, True])
+def test_dense_and_banded_assembly_agree(lumped, steel_beam):
+    histories = []
+    for assembly in ('banded', 'dense'):
+        solver = BeamSolver(
+            steel_beam, assembly=assembly, lazy=True
+            ).assemble()
+        loads = np.outer(
+            np.sin(np.linspace(0, 10, 201)), solver.global_system_loads_vector
+            )
+        histories.append(np.array([
+            step.displacements for step in time_history(
+                solver, loads, 1e-3, alpha=-0.1, mass_damping=20,
+                stiffness_damping=1e-4, lumped=lumped
+                )
+            ]))
+
+    banded, dense = histories
+    assert np.allclose(dense, banded, rtol=0, atol=1e-9*np.abs(banded).max())
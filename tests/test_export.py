@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import (
+    BeamMesh, BeamSolver, export_npz, results_array, results_chunks
+)
+
+pytest.importorskip('scipy')
+
+
+def solver(elements=25):
+    mesh = BeamMesh(
+        np.linspace(0.1, 0.6, elements), 2e8, linear_load=-1e3
+        )
+    mesh.boundaries[0, :2] = True
+    return BeamSolver(mesh, lazy=True)
+
+
+@pytest.mark.parametrize('compress', [False, True])
+@pytest.mark.parametrize('chunk_size', [4, 25, 100])
+def test_export_npz_matches_results_array(tmp_path, chunk_size, compress):
+    results = solver().solve()
+    path = tmp_path / 'results.npz'
+    export_npz(path, results, chunk_size=chunk_size, compress=compress)
+
+    expected = results_array(results)
+    with np.load(path) as exported:
+        assert sorted(exported.files) == sorted(expected.dtype.names)
+        for name in expected.dtype.names:
+            np.testing.assert_array_equal(exported[name], expected[name])
+
+
+def test_export_npz_of_many_load_cases(tmp_path):
+    beam = solver()
+    loads = np.random.default_rng(0).random((beam.assemble().n, 3))
+    results = beam.solve(loads=loads)
+    path = tmp_path / 'results.npz'
+    export_npz(
+        path, results, chunk_size=7, columns=('x', 'M'), dtype=np.float32
+        )
+
+    expected = results_array(results)
+    with np.load(path) as exported:
+        assert exported.files == ['x', 'M']
+        assert exported['x'].shape == (50,)
+        assert exported['M'].shape == (50, 3)
+        assert exported['M'].dtype == np.float32
+        np.testing.assert_allclose(exported['x'], expected['x'], rtol=1e-6)
+        np.testing.assert_allclose(exported['M'], expected['M'], rtol=1e-5)
+
+
+def test_results_chunks():
+    results = solver().solve()
+    chunks = list(results_chunks(results, chunk_size=10, columns=('x', 'd')))
+
+    assert [name for name, _ in chunks] == ['x']*3 + ['d']*3
+    assert [values.shape for _, values in chunks[:3]] == [(20,), (20,), (10,)]
+    expected = results_array(results)
+    for name in 'xd':
+        np.testing.assert_array_equal(
+            np.concatenate([values for column, values in chunks
+                            if column == name]),
+            expected[name]
+            )
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import Beam, BeamMesh, BeamSolver
+from easyfem.easybeam.linalg import LowRankUpdate
+
+pytest.importorskip('scipy')
+
+ASSEMBLIES = ['banded', 'dense']
+
+
+def continuous_beam(elements=60):
+    mesh = BeamMesh(
+        np.full(elements, 0.5), np.linspace(1e8, 3e8, elements),
+        linear_load=-1e3
+        )
+    mesh.boundaries[0, :2] = True
+    mesh.boundaries[elements // 2, 0] = True
+    mesh.boundaries[-1, 2] = True
+    return mesh
+
+
+def fresh(mesh, assembly):
+    # new solver of copied arrays, nothing reused
+    arrays = {name: np.array(value) for name, value in mesh.arrays().items()}
+    return BeamSolver(
+        BeamMesh.from_arrays(arrays), assembly=assembly, lazy=True
+        ).solve()
+
+
+def assert_same(results, expected):
+    for name in ('displacements', 'internal_forces'):
+        value, reference = getattr(results, name), getattr(expected, name)
+        assert np.allclose(
+            value, reference, rtol=0, atol=1e-9*np.abs(reference).max()
+            )
+
+
+@pytest.mark.parametrize('assembly', ASSEMBLIES)
+def test_lazy_low_rank_update(assembly):
+    mesh = continuous_beam()
+    solver = BeamSolver(mesh, assembly=assembly, lazy=True)
+    solver.solve()
+
+    mesh.writable('youngs_modulus')[[3, 17, 40]] *= [2, 0.5, 4]
+    mesh.writable('linear_load')[10] = -5e3
+    results = solver.solve()
+
+    assert isinstance(solver.stiffness_factorization, LowRankUpdate)
+    assert_same(results, fresh(mesh, assembly))
+
+
+@pytest.mark.parametrize('assembly', ASSEMBLIES)
+def test_fallback_past_low_rank_limit(assembly):
+    mesh = continuous_beam()
+    solver = BeamSolver(mesh, assembly=assembly, lazy=True)
+    solver.solve()
+
+    refactorized = False
+    for element in range(0, 60, 2):
+        mesh.writable('youngs_modulus')[element] *= 1.5
+        results = solver.solve()
+        factorization = solver.stiffness_factorization
+        refactorized |= not isinstance(factorization, LowRankUpdate)
+        if isinstance(factorization, LowRankUpdate):
+            assert factorization.rank <= solver.low_rank_limit
+        assert_same(results, fresh(mesh, assembly))
+
+    assert refactorized
+
+
+@pytest.mark.parametrize('assembly', ASSEMBLIES)
+def test_many_edits_reassemble(assembly):
+    mesh = continuous_beam()
+    solver = BeamSolver(mesh, assembly=assembly, lazy=True)
+    solver.solve()
+
+    mesh.writable('youngs_modulus')[::2] *= 3
+    assert_same(solver.solve(), fresh(mesh, assembly))
+
+
+@pytest.mark.parametrize('assembly', ASSEMBLIES)
+def test_eager_update_of_mesh(assembly):
+    mesh = continuous_beam()
+    solver = BeamSolver(mesh, assembly=assembly)
+
+    mesh.writable('youngs_modulus')[[5, 6]] *= 2
+    mesh.writable('linear_load')[30] = -2e3
+    solver.update(5, 6, 30)
+
+    expected = fresh(mesh, assembly)
+    assert np.allclose(mesh.internal_forces, expected.internal_forces)
+    assert np.allclose(
+        solver.global_solvings_vector, expected.displacements, rtol=1e-9
+        )
+
+
+@pytest.mark.parametrize('assembly', ASSEMBLIES)
+def test_eager_update_of_beams(assembly):
+    beams = [Beam(1.0, 2e8) for _ in range(10)]
+    solver = BeamSolver(beams, assembly=assembly)
+
+    beams[4].youngs_modulus = 6e8
+    beams[4].stifness()
+    beams[7].loads(force_1=100)
+    solver.update(4, 7)
+
+    expected = BeamSolver(beams, assembly=assembly, lazy=True).solve()
+    assert np.allclose(
+        [beam.internal_forces_array for beam in beams],
+        expected.internal_forces
+        )
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamSolver, modal_analysis
+
+pytest.importorskip('scipy')
+
+LENGTH = 10.0
+YOUNGS_MODULUS = 2e11
+DENSITY = 7850
+
+
+@pytest.fixture
+def steel_beam(simply_supported):
+    return simply_supported(
+        100, LENGTH, youngs_modulus=YOUNGS_MODULUS, density=DENSITY
+        )
+
+
+def test_simply_supported_frequencies(steel_beam):
+    # f_k = k^2 pi / (2 L^2) sqrt(EI / rho A), with I = A = 1
+    results = modal_analysis(
+        BeamSolver(steel_beam, lazy=True), modes=3
+        )
+    exact = np.arange(1, 4)**2 * np.pi / (2*LENGTH**2) * \
+        np.sqrt(YOUNGS_MODULUS / DENSITY)
+
+    assert np.allclose(results.frequencies, exact, rtol=1e-4)
+
+
+@pytest.mark.parametrize('lumped', [False, True])
+def test_dense_and_banded_assembly_agree(lumped, steel_beam):
+    mesh = steel_beam
+    solvers = [
+        BeamSolver(mesh, assembly=assembly, lazy=True)
+        for assembly in ('banded', 'dense')
+        ]
+    results = [
+        modal_analysis(solver, modes=4, lumped=lumped, shift=10.0)
+        for solver in solvers
+        ]
+
+    for name in ('stiffness', 'mass'):
+        banded, dense = (solver.reduced_band(name) for solver in solvers)
+        assert banded.shape == dense.shape
+        assert np.allclose(banded, dense)
+    assert np.allclose(
+        results[0].frequencies, results[1].frequencies, rtol=1e-8
+        )
@@ -0,0 +1,96 @@
+import struct
+
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamMesh, load_model, save_model
+from easyfem.easybeam.modelfile import MAGIC, MODEL_FORMAT_VERSION
+
+
+def node_model():
+    # nodes given in any order, own density of every element,
+    # young's modulus and sections shared by all elements
+    mesh = BeamMesh(
+        np.full(4, 2.5), 2e8, linear_load=-1e3,
+        density=[7850, 7850, 2700, 2700],
+        nodes=[[12, 13], [10, 11], [13, 14], [11, 12]]
+        )
+    mesh.support(10)
+    mesh.support(14)
+    mesh.area = mesh.broadcast(1e-3)
+    mesh.moment_of_inertia_y = mesh.broadcast(1e-6)
+    return mesh
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_round_trip(tmp_path, mmap):
+    mesh = node_model()
+    path = tmp_path / 'model.beam'
+    save_model(path, mesh)
+    loaded = load_model(path, mmap=mmap)
+
+    saved = mesh.arrays()
+    arrays = loaded.arrays()
+    assert arrays.keys() == saved.keys()
+    for name, array in saved.items():
+        np.testing.assert_array_equal(arrays[name], array)
+        assert np.ndim(arrays[name]) == np.ndim(array)
+
+    # shared scalars stay broadcast views, not stored per element
+    assert np.ndim(saved['youngs_modulus']) == 0
+    assert np.ndim(saved['area']) == 0
+    assert loaded.youngs_modulus.strides == (0,)
+    np.testing.assert_array_equal(loaded.density, [7850, 7850, 2700, 2700])
+    np.testing.assert_array_equal(loaded.nodes, mesh.nodes)
+
+
+def test_newer_version_is_rejected(tmp_path):
+    path = tmp_path / 'model.beam'
+    save_model(path, node_model())
+
+    with open(path, 'r+b') as model:
+        _, _, length = struct.unpack('<8sHI', model.read(14))
+        model.seek(0)
+        model.write(struct.pack(
+            '<8sHI', MAGIC, MODEL_FORMAT_VERSION + 1, length
+            ))
+
+    with pytest.raises(ValueError, match='newer'):
+        load_model(path)
+
+
+def test_not_model_file_is_rejected(tmp_path):
+    path = tmp_path / 'model.beam'
+    path.write_bytes(b'NOTAMODEL' + bytes(32))
+
+    with pytest.raises(ValueError, match='not easybeam model file'):
+        load_model(path)
+
+
+def mapped(array):
+    # array is view of file when some of its bases is memmap
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_memory_mapped_arrays_are_copied_on_write(tmp_path):
+    path = tmp_path / 'model.beam'
+    save_model(path, node_model())
+    mesh = load_model(path)
+
+    assert mapped(mesh.lengths)
+    assert not mesh.lengths.flags.writeable
+    with pytest.raises(ValueError):
+        mesh.lengths[0] = 1.0
+
+    lengths = mesh.writable('lengths')
+    assert lengths.flags.writeable
+    assert not mapped(lengths)
+    lengths[0] = 1.0
+    assert mesh.lengths[0] == 1.0
+
+    # file is not changed
+    np.testing.assert_array_equal(load_model(path).lengths, np.full(4, 2.5))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamSolver, influence_lines
+
+pytest.importorskip('scipy')
+
+
+def test_positions_at_beam_ends(simply_supported):
+    # sum of 10^4 lengths differs from 10 by rounding
+    solver = BeamSolver(simply_supported(10**4), lazy=True)
+    lines = influence_lines(solver, positions=np.linspace(0, 10, 101))
+
+    assert np.allclose(lines.deflections[[0, -1]], 0, atol=1e-15)
+
+
+def test_midspan_moment(simply_supported):
+    # unit load at x gives midspan moment x/2 for x <= L/2
+    solver = BeamSolver(simply_supported(20), lazy=True)
+    positions = np.linspace(0, 10, 41)
+    lines = influence_lines(solver, positions=positions)
+    middle = np.searchsorted(lines.nodes, 5.0)
+
+    expected = np.minimum(positions, 10 - positions) / 2
+    assert np.allclose(np.abs(lines.moments[:, middle]), expected)
+
+
+def test_positions_outside_beam(simply_supported):
+    with pytest.raises(ValueError):
+        influence_lines(
+            BeamSolver(simply_supported(10), lazy=True), positions=[10.01]
+            )
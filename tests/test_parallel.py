@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import Beam, BeamMesh, BeamSolver, solve_many
+
+pytest.importorskip('scipy')
+
+
+def models(count=7):
+    for index in range(count):
+        mesh = BeamMesh(
+            np.full(10 + index, 0.5), 2e8 + 1e7*index, linear_load=-1e3
+            )
+        mesh.boundaries[0, :2] = True
+        yield mesh
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_solve_many_matches_solver(workers):
+    expected = [BeamSolver(mesh).solve() for mesh in models()]
+
+    solved = dict(solve_many(models(), workers=workers, chunksize=2))
+
+    assert sorted(solved) == list(range(len(expected)))
+    for index, results in solved.items():
+        for name in ('displacements', 'internal_forces', 'element_dofs'):
+            np.testing.assert_allclose(
+                getattr(results, name), getattr(expected[index], name)
+                )
+
+
+def test_solve_many_of_beams():
+    beam = Beam(5, 2e8)
+    beam.loads(linear_load=-1e3)
+    expected = [BeamSolver((beam,)).solve(), BeamSolver((beam, beam)).solve()]
+
+    for index, results in solve_many([beam, (beam, beam)], workers=0):
+        np.testing.assert_allclose(
+            results.displacements, expected[index].displacements
+            )
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamMesh, BeamSolver, results_array
+
+
+def solver(elements=20):
+    mesh = BeamMesh(np.full(elements, 0.5), 2e8, linear_load=-1e3)
+    mesh.boundaries[0, :2] = True
+    return BeamSolver(mesh, lazy=True)
+
+
+def test_results_array_of_many_load_cases():
+    beam = solver()
+    loads = np.random.default_rng(0).random((beam.assemble().n, 3))
+    results = results_array(beam.solve(loads=loads))
+
+    assert results['x'].shape == (40,)
+    for case in range(3):
+        single = results_array(beam.solve(loads=loads[:, [case]]))
+        assert np.array_equal(results['x'], single['x'])
+        for field in 'MTdr':
+            assert results[field].shape == (40, 3)
+            assert np.allclose(results[field][:, case], single[field][:, 0])
+
+
+def test_render_of_many_load_cases(tmp_path):
+    pytest.importorskip('matplotlib')
+    from easyfem.easybeam.render import render_results
+
+    beam = solver()
+    loads = np.ones((beam.assemble().n, 2))
+    render_results(tmp_path / 'results.png', beam.solve(loads=loads), case=1)
+
+    assert (tmp_path / 'results.png').stat().st_size > 0
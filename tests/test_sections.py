@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from easyfem.easysections import (
+    HollowCircle, HollowRectangle, IBeamSection, RectangleSection,
+    CircleSectionArray, HollowCircleArray, HollowRectangleArray,
+    IBeamSectionArray,
+    RectangleSectionArray, catalogue
+)
+
+PROPERTIES = (
+    'area', 'moment_of_inertia_y', 'moment_of_inertia_z',
+    'elastic_modulus_y', 'elastic_modulus_z'
+)
+
+# published properties (with root and corner radii):
+# area [m^2], mass [kg/m], moment_of_inertia_y [m^4],
+# elastic_modulus_y [m^3]
+PUBLISHED = {
+    'IPE300': (53.8e-4, 42.2, 8356e-8, 557e-6),
+    'HEB200': (78.1e-4, 61.3, 5696e-8, 570e-6),
+    'RHS100x50x5': (13.6e-4, 10.7, 167e-8, 33.5e-6),
+    'CHS114.3x5': (17.2e-4, 13.5, 257e-8, 45.0e-6),
+}
+
+
+def test_rectangle_properties():
+    section = RectangleSection(0.2, 0.1)
+
+    assert np.isclose(section.elastic_modulus_y, 0.1*0.2**2 / 6)
+    assert np.isclose(section.elastic_modulus_z, 0.2*0.1**2 / 6)
+
+
+def test_hollow_rectangle_wall_thickness():
+    section = HollowRectangle(0.1, 0.05, 0.005)
+
+    assert np.isclose(section.area, 0.1*0.05 - 0.09*0.04)
+    assert np.isclose(
+        section.elastic_modulus_y, section.moment_of_inertia_y / 0.05
+        )
+
+
+@pytest.mark.parametrize('scalar, array, dimensions', [
+    (RectangleSection, RectangleSectionArray, (0.2, 0.1)),
+    (HollowCircle, HollowCircleArray, (0.1143, 0.1043)),
+    (HollowRectangle, HollowRectangleArray, (0.1, 0.05, 0.005)),
+    (IBeamSection, IBeamSectionArray, (0.3, 0.15, 0.0107, 0.0071)),
+])
+def test_arrays_match_scalar_sections(scalar, array, dimensions):
+    single = scalar(*dimensions)
+    sections = array(*([value, value] for value in dimensions))
+
+    for name in PROPERTIES:
+        assert np.allclose(getattr(sections, name), getattr(single, name))
+
+
+@pytest.mark.parametrize('designation', sorted(PUBLISHED))
+def test_catalogue_close_to_published(designation):
+    profile = catalogue.table[catalogue.row(designation)]
+    area, mass, inertia, modulus = PUBLISHED[designation]
+
+    # radii are ignored, so properties differ by few percent
+    assert np.isclose(profile['area'], area, rtol=0.06)
+    assert np.isclose(profile['mass'], mass, rtol=0.06)
+    assert np.isclose(profile['moment_of_inertia_y'], inertia, rtol=0.06)
+    assert np.isclose(profile['elastic_modulus_y'], modulus, rtol=0.06)
+
+
+def test_catalogue_sections_match_table():
+    for designation in PUBLISHED:
+        section = catalogue[designation]
+        profile = catalogue.table[catalogue.row(designation)]
+        for name in PROPERTIES:
+            assert np.isclose(getattr(section, name), profile[name])
+
+
+def test_array_sections_as_beam_section():
+    from easyfem.easybeam import Beam, BeamMesh
+
+    sections = RectangleSectionArray([0.1, 0.2], 0.1)
+    with pytest.raises(TypeError, match='BeamMesh'):
+        Beam(1, section=sections)
+
+    beam = Beam(1, section=sections[1:])
+    assert beam.moment_of_inertia_z == sections[1].moment_of_inertia_z
+
+    mesh = BeamMesh([1, 1], section=sections)
+    assert np.allclose(
+        mesh.moment_of_inertia_z, sections.moment_of_inertia_z
+        )
+
+
+def test_array_of_scalar_dimensions():
+    from easyfem.easybeam import Beam, BeamMesh
+
+    sections = RectangleSectionArray(0.3, 0.2)
+    single = RectangleSection(0.3, 0.2)
+
+    assert len(sections) == 1
+    assert len(list(sections)) == 1
+    assert sections[0].area == single.area
+    assert Beam(1, section=sections).moment_of_inertia_z == \
+        single.moment_of_inertia_z
+    assert BeamMesh([1, 1], section=sections)[1].section.area == single.area
+
+
+@pytest.mark.parametrize('array, dimensions', [
+    (RectangleSectionArray, ([0.1, 0], 0.1)),
+    (CircleSectionArray, ([0.1, 0],)),
+])
+def test_zero_dimensions_rejected(array, dimensions):
+    with pytest.raises(ValueError, match='non-zero'):
+        array(*dimensions)
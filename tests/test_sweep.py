@@ -0,0 +1,47 @@
+import numpy as np
+
+from easyfem.easybeam import BeamMesh, BeamSolver, sweep
+
+
+def shuffled_mesh(elements=40, seed=0):
+    # simply supported beam, elements and node ids in random order
+    rng = np.random.default_rng(seed)
+    ids = rng.permutation(elements + 1) * 3 + 7
+    order = rng.permutation(elements)
+    mesh = BeamMesh(
+        np.full(elements, 0.25), 2e8, linear_load=-1e3,
+        nodes=np.stack([ids[:-1], ids[1:]], axis=1)[order]
+        )
+    mesh.support(ids[0])
+    mesh.support(ids[-1])
+    return mesh
+
+
+def expected(mesh):
+    BeamSolver(mesh)
+    forces = mesh.internal_forces
+    return (
+        np.abs(forces[:, [1, 3]]).max(),
+        np.abs(mesh.displacements[:, [0, 2]]).max()
+        )
+
+
+def test_sweep_of_node_based_mesh():
+    mesh = shuffled_mesh()
+    results = sweep(mesh, youngs_modulus=[2e8])
+
+    moment, deflection = expected(mesh)
+    assert np.isclose(results.max_moment[0], moment)
+    assert np.isclose(results.max_deflection[0], deflection)
+
+
+def test_sweep_variants_match_solver():
+    mesh = shuffled_mesh()
+    youngs = np.linspace(1e8, 3e8, mesh.lengths.size)
+    results = sweep(mesh, youngs_modulus=[youngs, 2*youngs])
+
+    for variant, factor in enumerate((1, 2)):
+        mesh.youngs_modulus = factor * youngs
+        moment, deflection = expected(mesh)
+        assert np.isclose(results.max_moment[variant], moment)
+        assert np.isclose(results.max_deflection[variant], deflection)
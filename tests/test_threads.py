@@ -0,0 +1,54 @@
+import threading
+
+import numpy as np
+import pytest
+
+from easyfem.easybeam import BeamMesh, BeamSolver
+
+pytest.importorskip('scipy')
+
+
+def test_concurrent_solves_during_edits():
+    elements = 400
+    mesh = BeamMesh(np.full(elements, 0.1), 2e8, linear_load=-1e3)
+    mesh.boundaries[0, :2] = True
+    mesh.boundaries[-1, 2] = True
+    states = [np.full(elements, 2e8), np.full(elements, 2e8)]
+    states[1][::50] = 8e8
+
+    solver = BeamSolver(mesh, lazy=True)
+    loads = np.zeros([solver.assemble().n, 1])
+    loads[elements] = 1e3
+    expected = []
+    for state in states:
+        mesh.youngs_modulus = state
+        expected.append(solver.solve(loads=loads).displacements)
+
+    errors = []
+    stop = threading.Event()
+
+    def edit():
+        for step in range(60):
+            mesh.youngs_modulus = states[step % 2]
+            solver.solve()
+        stop.set()
+
+    def read():
+        while not stop.is_set():
+            try:
+                result = solver.solve(loads=loads).displacements
+            except Exception as error:
+                errors.append(error)
+                return
+            if not any(np.allclose(result, value) for value in expected):
+                errors.append(AssertionError('mixed solver states'))
+                return
+
+    threads = [threading.Thread(target=read) for _ in range(3)]
+    threads.append(threading.Thread(target=edit))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
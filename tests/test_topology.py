@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from easyfem.easybeam import (
+    BeamMesh, BeamSolver, coordinates_array, export_npz, momments_array,
+    results_array, results_chunks
+)
+
+
+def node_mesh():
+    mesh = BeamMesh(
+        np.full(4, 2.5), 2e8, linear_load=-1e3,
+        nodes=[[12, 13], [10, 11], [13, 14], [11, 12]]
+        )
+    mesh.support(10)
+    mesh.support(14)
+    return mesh
+
+
+@pytest.mark.parametrize('model', ['mesh', 'solver', 'results'])
+def test_coordinates_need_chained_elements(model, tmp_path):
+    mesh = node_mesh()
+    solver = BeamSolver(mesh)
+    beams = {
+        'mesh': mesh, 'solver': solver, 'results': solver.solve()
+    }[model]
+
+    for function in (coordinates_array, results_array):
+        with pytest.raises(ValueError, match='chained'):
+            function(beams)
+    with pytest.raises(ValueError, match='chained'):
+        list(results_chunks(beams))
+    with pytest.raises(ValueError, match='chained'):
+        export_npz(tmp_path / 'results.npz', beams)
+
+    # values of elements do not need coordinates
+    assert momments_array(beams).shape == (8,)
+    assert len(list(results_chunks(beams, columns=('M',)))) == 1
+
+
+def test_node_mesh_matches_chained_mesh():
+    # shuffled elements give same forces as chained ones
+    chained = BeamMesh(np.full(4, 2.5), 2e8, linear_load=-1e3)
+    chained.boundaries[0, 0] = chained.boundaries[-1, 2] = True
+    mesh = node_mesh()
+
+    BeamSolver(chained)
+    BeamSolver(mesh)
+    order = [1, 3, 0, 2]
+    assert np.allclose(mesh.internal_forces[order], chained.internal_forces)